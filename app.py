@@ -9,7 +9,7 @@ r"""
     @author: Suraj Kumar Giri (https://github.com/surajgirioffl)
     @init-date: 24th Nov 2023
     @completed-on: N/A
-    @last-modified: 26th Jan 2024
+    @last-modified: 19th Oct 2026
     @error-series: 1100
     @description:
         - Main module of the application (Driver module).
@@ -19,12 +19,13 @@ __author__ = "Suraj Kumar Giri"
 __email__ = "surajgirioffl@gmail.com"
 __version__ = "2.0.0"
 
-from time import sleep, time
+from time import perf_counter
 import logging
 from sys import exit
 from os.path import exists
 from shutil import move
 from os import remove
+from copy import deepcopy
 from datetime import datetime
 from typing import Literal, Any
 from selenium import webdriver
@@ -33,7 +34,7 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.service import Service
 import undetected_chromedriver as uc
 from components import ip, google_sheets, microsoft, magzter, stripe
-from utilities import tools, scrap_tools
+from utilities import tools, scrap_tools, throughput, content_blocking, webdriver_cache, pipeline
 from db_scripts import spreadsheet_db
 
 # Loading application settings
@@ -60,6 +61,23 @@ microsoftUrl: str = settings["url"]["microsoft"]
 outlookUrl: str = settings["url"]["outlook"]
 magzterUrl: str = settings["url"]["magzter"]
 
+# Content blocking profile of the browser sessions
+blockingSettings: dict = settings["browser"]["blocking"]
+
+# Driver and browser binaries resolved by Selenium Manager (resolved once and reused by all browser sessions)
+webDriverCache = webdriver_cache.WebDriverCache(settings["app"]["webdriver_cache_file"])
+
+
+# Columns which must be filled in a row to process it. Checked when the row is fetched (not deep in the flow).
+REQUIRED_ROW_FIELDS: tuple[str, ...] = (
+    "microsoft_email",
+    "password",
+    "card_number",
+    "card_expiry",
+    "card_cvv",
+    "cardholder_name",
+)
+
 
 # Tab class to handling multiple tabs. It makes easy to switch between different tabs.
 class Tab:
@@ -87,7 +105,11 @@ def performInitialSpreadsheetOperations() -> tuple[str, str, google_sheets.Googl
     sheetName = inputFromUserIfNone(sheetName, "sheet")
 
     print(f"Fetching spreadsheet {spreadSheetName}...")
-    gs = google_sheets.GoogleSheets(spreadSheetName, sheetTitleOrIndex=sheetName)
+    gs = google_sheets.GoogleSheets(
+        spreadSheetName,
+        sheetTitleOrIndex=sheetName,
+        headersWithIndex=settings["spreadsheet"]["headers_with_index"],
+    )
 
     print(f"Exporting spreadsheet to backups/{spreadSheetName}.xlsx if not exported earlier.")
 
@@ -132,6 +154,12 @@ class Menu:
         print("Press 1 if Payment Successful.")
         print("Press 2 if Payment Failed.")
 
+    @staticmethod
+    def abortedRowMenu() -> None:
+        print("=========================ABORTED ROW MENU=============================")
+        print("Press 1 to skip this row and continue with the next row.")
+        print("Press 2 to stop the automation (fix the issue and run again).")
+
 
 def confirmPaymentStatus() -> bool:
     while True:
@@ -147,6 +175,20 @@ def confirmPaymentStatus() -> bool:
             print("Invalid choice...")
 
 
+def confirmSkipAbortedRow() -> bool:
+    while True:
+        Menu.abortedRowMenu()
+        choice: str = input("Write your choice: ")
+        if choice == "1":
+            # Skip the row
+            return True
+        if choice == "2":
+            # Stop
+            return False
+        else:
+            print("Invalid choice...")
+
+
 def createLastSuccessStatJSONFile(
     spreadsheetName: str = None,
     sheetName: str = None,
@@ -166,6 +208,14 @@ def createLastSuccessStatJSONFile(
     tools.saveDictAsJSON(data, lastSuccessStatFilePath)
 
 
+def logPageLoadStatistics(driverInstance: webdriver.Firefox | webdriver.Chrome, pageName: str) -> None:
+    # Requests/bytes of the current page and savings of the content blocking
+    if blockingSettings["log_statistics"]:
+        summary: str = content_blocking.getPageLoadStatisticsSummary(driverInstance)
+        print(f"{pageName} page: {summary}")
+        logging.info(f"{pageName} page: {summary}")
+
+
 def getUniqueIPAddress(spreadsheetDb: spreadsheet_db.Spreadsheet) -> str:
     while True:
         print("Fetching your current IP address...")
@@ -185,56 +235,90 @@ def getUniqueIPAddress(spreadsheetDb: spreadsheet_db.Spreadsheet) -> str:
 
 
 class NewDriverInstance:
+    # Options templates (browser name -> options) built once per run.
+    # Options can't be shared between sessions (Selenium modifies them). So, a copy of template is used for each session.
+    optionsTemplates: dict[str, Any] = {}
+
     @staticmethod
-    def getNewChromeInstance():
-        # Options and services must be initialized for each browser session because when you quit a browser then these objects are also destroyed.
-        # Adding chrome options based on user settings
-        chromeOptions = webdriver.chrome.options.Options()
-        if not settings["browser"]["display_images"]:
-            chromeOptions.add_argument("--blink-settings=imagesEnabled=false")
-        if settings["browser"]["headless"]:
-            chromeOptions.add_argument("--headless")
+    def getOptions(browserName: str) -> Any:
+        if browserName not in NewDriverInstance.optionsTemplates:
+            # Adding options based on user settings
+            if browserName == "firefox":
+                options = webdriver.firefox.options.Options()
+                if not settings["browser"]["display_images"]:
+                    options.set_preference("permissions.default.image", 2)
+                content_blocking.applyFirefoxBlockingOptions(options, blockingSettings)
+            else:
+                options = (
+                    webdriver.chrome.options.Options()
+                    if browserName == "chrome"
+                    else webdriver.edge.options.Options()
+                )
+                if not settings["browser"]["display_images"]:
+                    options.add_argument("--blink-settings=imagesEnabled=false")
+                if browserName == "chrome":
+                    content_blocking.applyChromeBlockingOptions(options, blockingSettings)
+            if settings["browser"]["headless"]:
+                options.add_argument("--headless")
+            NewDriverInstance.optionsTemplates[browserName] = options
+        return deepcopy(NewDriverInstance.optionsTemplates[browserName])
 
-        # Services
-        service = Service(
-            executable_path=settings["webdriver"]["executable_path"],
-            port=settings["webdriver"]["port"],
-        )
-        return webdriver.Chrome(options=chromeOptions, service=service)
+    @staticmethod
+    def getService(browserName: str, options: Any) -> Service:
+        # Services must be initialized for each browser session because when you quit a browser then the service is also stopped.
+        # But driver/browser paths are resolved only once (unless executable path is specified in the settings).
+        executablePath: str | None = settings["webdriver"]["executable_path"]
+        if executablePath is None:
+            executablePath, browserPath = webDriverCache.resolve(browserName, options)
+            if browserPath:
+                options.binary_location = browserPath
+        return Service(executable_path=executablePath, port=settings["webdriver"]["port"])
 
     @staticmethod
-    def getNewEdgeInstance():
-        # Options and services must be initialized for each browser session because when you quit a browser then these objects are also destroyed.
-        # Adding edge options based on user settings
-        edgeOptions = webdriver.edge.options.Options()
-        if not settings["browser"]["display_images"]:
-            edgeOptions.add_argument("--blink-settings=imagesEnabled=false")
-        if settings["browser"]["headless"]:
-            edgeOptions.add_argument("--headless")
+    def logLaunchTime(browserName: str, startTime: float) -> None:
+        message: str = f"{browserName} launched in {perf_counter() - startTime:.2f} seconds."
+        print(message)
+        logging.info(message)
 
-        # Services
-        service = Service(
-            executable_path=settings["webdriver"]["executable_path"],
-            port=settings["webdriver"]["port"],
-        )
-        return webdriver.Edge(options=edgeOptions, service=service)
+    @staticmethod
+    def launch(browserName: str, driverClass: type) -> Any:
+        options = NewDriverInstance.getOptions(browserName)
+        try:
+            return driverClass(options=options, service=NewDriverInstance.getService(browserName, options))
+        except Exception as e:
+            if settings["webdriver"]["executable_path"] is not None:
+                raise
+            # Cached driver/browser path may not work anymore (E.g: replaced binary). So, resolving again (once).
+            print(
+                f"Unable to launch {browserName} with the cached webdriver paths. Resolving again... Error Code: 1108"
+            )
+            print("Exception:", e)
+            webDriverCache.invalidate(browserName)
+            options = NewDriverInstance.getOptions(browserName)
+            return driverClass(options=options, service=NewDriverInstance.getService(browserName, options))
 
     @staticmethod
-    def getNewFirefoxInstance():
-        # Options and services must be initialized for each browser session because when you quit a browser then these objects are also destroyed.
-        # Adding firefox options based on user settings
-        firefoxOptions = webdriver.firefox.options.Options()
-        if not settings["browser"]["display_images"]:
-            firefoxOptions.set_preference("permissions.default.image", 2)
-        if settings["browser"]["headless"]:
-            firefoxOptions.add_argument("--headless")
+    def getNewChromeInstance():
+        startTime: float = perf_counter()
+        driver = NewDriverInstance.launch("chrome", webdriver.Chrome)
+        content_blocking.enableChromeBlocking(driver, blockingSettings)
+        NewDriverInstance.logLaunchTime("Chrome", startTime)
+        return driver
 
-        # Services
-        service = Service(
-            executable_path=settings["webdriver"]["executable_path"],
-            port=settings["webdriver"]["port"],
-        )
-        return webdriver.Firefox(options=firefoxOptions, service=service)
+    @staticmethod
+    def getNewEdgeInstance():
+        startTime: float = perf_counter()
+        driver = NewDriverInstance.launch("edge", webdriver.Edge)
+        NewDriverInstance.logLaunchTime("Edge", startTime)
+        return driver
+
+    @staticmethod
+    def getNewFirefoxInstance():
+        startTime: float = perf_counter()
+        driver = NewDriverInstance.launch("firefox", webdriver.Firefox)
+        content_blocking.enableFirefoxBlocking(driver, blockingSettings)
+        NewDriverInstance.logLaunchTime("Firefox", startTime)
+        return driver
 
 
 class NewUndetectableDriverInstance:
@@ -254,44 +338,66 @@ class NewUndetectableDriverInstance:
         return uc.Chrome(options=chromeOptions, service=service)
 
 
-def main() -> None:
-    # *********************************Scraping Objects & Variables*********************************
-    spreadSheetName, sheetName, gs = performInitialSpreadsheetOperations()  # gs is a GoogleSheets object
-
-    lastSuccessStatFilePath: str = settings["app"]["last_success_stat_file"]
-    headersWithIndex: dict = settings["spreadsheet"]["headers_with_index"]
+def quitBrowsers(context: pipeline.RowContext) -> None:
+    # Ensure that both browsers are closed regardless of what happens in the row.
+    for driverInstance in (context.driver, context.uDriver):
+        if driverInstance is not None:
+            try:
+                driverInstance.quit()
+            except Exception as e:
+                print("Unable to close the browser. Error Code: 1105")
+                print("Exception:", e)
+
+
+def buildRowPipeline(
+    gs: google_sheets.GoogleSheets,
+    spreadsheetDb: spreadsheet_db.Spreadsheet,
+    spreadSheetName: str,
+    sheetName: str,
+    lastSuccessStatFilePath: str,
+) -> pipeline.Pipeline:
+    # Steps of a row (in order). Timeout and retry policy of each step can be overridden in the settings.
+    pipelineSettings: dict = settings["pipeline"]
     headersWithColumn: dict = settings["spreadsheet"]["headers_with_column"]
-
-    spreadsheetDb = spreadsheet_db.Spreadsheet(spreadSheetName, sheetName)
-
-    # Scraping Starts
-    # *************************************Scraping Starts*************************************
-
-    # TODO -> Fetching desired row number to start and data of the respective row from the Google sheet
-    rowNumber: int = fetchRowNumberToStart(spreadSheetName, sheetName, lastSuccessStatFilePath)
-    index = 0
-
-    while True:
-        iterationStartTime: float = time()
-        # Options and services must be initialized for each browser session because when you quit a browser then these objects are also destroyed.
+    # Upper limit of a single wait (used when there is no deadline)
+    maxWaitTime: float = pipelineSettings["max_wait_time"]
+    # Next rows are fetched in a single request and used by the next fetch_row steps (row number -> record).
+    # Prefetched rows are not read again. So, edits in the sheet (E.g: card details) during the run are missed.
+    # Default 1 (no read-ahead). Each row is read just before it is processed.
+    prefetchRows: int = max(settings["spreadsheet"]["prefetch_rows"], 1)
+    prefetchedRows: dict[int, google_sheets.RowRecord | None] = {}
+
+    rowPipeline = pipeline.Pipeline(pipelineSettings["row_budget"], pipelineSettings["steps"])
+
+    @rowPipeline.step("init_browser", timeout=90, retries=1, retryDelay=5)
+    def initBrowser(context: pipeline.RowContext, deadline: pipeline.Deadline) -> None:
         # New browser session (Because clear cookies is not working for microsoft)
-        # Initializing the chrome webdriver
         print("\nInitializing a new browser session...")
-        driver: webdriver.Firefox = NewDriverInstance.getNewFirefoxInstance()
+        quitBrowsers(context)  # Browser of the failed attempt (if any)
+        context.driver = NewDriverInstance.getNewFirefoxInstance()
         print("Browser session initialized successfully...")
 
         # Initializing the objects of Microsoft and Magzter
-        ms: microsoft.Microsoft = microsoft.Microsoft(driver)
-        mg: magzter.Magzter = magzter.Magzter(driver)
+        context.ms = microsoft.Microsoft(context.driver)
+        context.mg = magzter.Magzter(context.driver)
 
-        print(f"\n\n======================== FOR ROW NUMBER {rowNumber} ========================")
-        # TODO -> Checking IP
+    @rowPipeline.step("check_ip", interactive=True)
+    def checkIP(context: pipeline.RowContext, deadline: pipeline.Deadline) -> None:
         print("Fetching your current IP address...")
-        currentIP = getUniqueIPAddress(spreadsheetDb)
-
-        print(f"Fetching contents of row number {rowNumber}...")
-        rowData: list = gs.getRowValues(rowNumber)
-        if not rowData:
+        context.currentIP = getUniqueIPAddress(spreadsheetDb)
+
+    @rowPipeline.step("fetch_row", timeout=30, retries=2, retryDelay=5)
+    def fetchRow(context: pipeline.RowContext, deadline: pipeline.Deadline) -> None:
+        print(f"Fetching contents of row number {context.rowNumber}...")
+        # A retry fetches again (prefetched row may be the cause of the failure)
+        if context.rowNumber not in prefetchedRows or context.attempt > 1:
+            records: list[google_sheets.RowRecord | None] = gs.getRowRecords(
+                context.rowNumber, context.rowNumber + prefetchRows - 1
+            )
+            prefetchedRows.clear()
+            prefetchedRows.update(enumerate(records, start=context.rowNumber))
+        row: google_sheets.RowRecord | None = prefetchedRows.pop(context.rowNumber)
+        if row is None:
             # If the row is empty. Means all rows have been fetched.
             # Complete the transaction and exit.
             move(lastSuccessStatFilePath, "appdata/history/last-success-statics/")
@@ -299,128 +405,240 @@ def main() -> None:
                 f"Scraping and manipulation of sheet {sheetName} of Spreadsheet {spreadSheetName} completed successfully..."
             )
             print("Last success stat file removed successfully...")
-            break
-
-        print(f"Fetched row data: {rowData}")
+            raise pipeline.StopPipeline()
+
+        print(f"Fetched row data: {row}")
+        missingFields: list[str] = [name for name in REQUIRED_ROW_FIELDS if not getattr(row, name).strip()]
+        if missingFields:
+            # Retrying won't fill the fields. So, the row is aborted and the user decides to skip it or stop.
+            raise pipeline.AbortRow(
+                f"Row {context.rowNumber} has empty required fields: {', '.join(missingFields)}"
+            )
+        context.row = row
 
-        # TODO -> Login to Microsoft and open outlook
+    @rowPipeline.step("microsoft_login", timeout=90, retries=1, retryDelay=3)
+    def microsoftLogin(context: pipeline.RowContext, deadline: pipeline.Deadline) -> None:
         # Microsoft in tab index 0
         print("Login to Microsoft and open Outlook...")
-        email: str = rowData[headersWithIndex["microsoft_email"]]
-        password: str = rowData[headersWithIndex["password"]]
-        scrap_tools.switchTab(driver, Tab.Microsoft)
-        ms.login(microsoftUrl, email, password)
-        ms.openOutlook(outlookUrl)
-
-        # TODO -> Login to Magzter till send OTP
-        # Opening new tab for Magzter
-        scrap_tools.openNewTab(driver)
+        scrap_tools.switchTab(context.driver, Tab.Microsoft)
+        context.ms.login(
+            microsoftUrl, context.row.microsoft_email, context.row.password, deadline.remaining(maxWaitTime)
+        )
+        context.ms.openOutlook(outlookUrl, deadline.remaining(maxWaitTime))
+        # Once per page load (not on each OTP attempt)
+        logPageLoadStatistics(context.driver, "Outlook")
+
+    @rowPipeline.step("magzter_login", timeout=60, retries=1, retryDelay=3)
+    def magzterLogin(context: pipeline.RowContext, deadline: pipeline.Deadline) -> None:
+        # Opening new tab for Magzter (only once, even if the step is retried)
+        if len(context.driver.window_handles) <= Tab.Magzter:
+            scrap_tools.openNewTab(context.driver)
         # Magzter in tab index 1
         print("Login to Magzter and send OTP...")
-        scrap_tools.switchTab(driver, Tab.Magzter)
-        mg.login(magzterUrl, email)  # OTP sent
+        scrap_tools.switchTab(context.driver, Tab.Magzter)
+        context.mg.login(magzterUrl, context.row.microsoft_email, deadline.remaining(maxWaitTime))  # OTP sent
+
+    # Falls back to the user on its last attempt. So, the last attempt is run even if no time is left for retries.
+    @rowPipeline.step("otp", timeout=180, retries=8, retryDelay=5, lastAttemptFallback=True)
+    def fetchAndWriteOTP(context: pipeline.RowContext, deadline: pipeline.Deadline) -> None:
+        # One attempt to fetch and write the OTP. Attempts are bounded by the retry policy of the step.
+        print("-- Fetching and Writing OTP")
+        try:
+            if deadline.isExpired():
+                # Only possible on the last attempt. No time to fetch the OTP, so the user writes it.
+                raise pipeline.RetryStep("No time left to fetch OTP.")
 
-        # TODO -> Fetching and writing OTP
-        print("Fetching and writing OTP...")
-        while True:
-            print("-- Fetching and Writing OTP")
             # Fetching OTP from microsoft tab
-            scrap_tools.switchTab(driver, Tab.Microsoft)
-            otp: str = ms.fetchOTP()
+            scrap_tools.switchTab(context.driver, Tab.Microsoft)
+            otp: str = context.ms.fetchOTP(deadline.remaining(maxWaitTime))
             print("otp: ", otp)
             if not otp.strip():
-                print("OTP is empty. Retrying to fetch OTP...")
-                continue
+                raise pipeline.RetryStep("OTP is empty. Retrying to fetch OTP...")
 
             # Writing OTP to magzter tab
-            scrap_tools.switchTab(driver, Tab.Magzter)
-            mg.writeOTP(otp)
-            sleep(1)  # sleep for 1 second
+            scrap_tools.switchTab(context.driver, Tab.Magzter)
+            context.mg.writeOTP(otp, deadline.remaining(maxWaitTime))
 
-            status: bool | None = mg.isOTPSuccessfullySubmitted(maxWaitTimeForURLChange=5)  # Time consuming.
+            # Waits for the URL change. So, no need to sleep after writing the OTP.
+            status: bool | None = context.mg.isOTPSuccessfullySubmitted(
+                maxWaitTimeForURLChange=deadline.remaining(5)
+            )
             print("OTP fetch status:", status)
-
             if status:
-                # OTP successfully submitted. So, break the loop.
                 print("OTP successfully submitted..")
-                break
-            elif status is None:
-                # Invalid OTP. So, retry to fetch OTP.
-                print("Invalid OTP. Retrying to fetch OTP...")
-                continue
-            else:
-                # Some other error. So, switch the control to user.
-                otpByUser = input("Write OTP: ")
-                # Writing OTP to magzter tab
-                mg.writeOTP(otpByUser)
-                break
+                return
+            if status is None:
+                raise pipeline.RetryStep("Invalid OTP. Retrying to fetch OTP...")
+        except Exception as e:
+            if not context.isLastAttempt:
+                raise
+            print("Unable to fetch and write OTP automatically. Error Code: 1106")
+            print("Exception:", e)
 
-        paymentPageLink: str = driver.current_url
-        # TODO -> Fetching and writing card information (Stripe page works)
+        # Some other error (or no attempts/time left). So, switch the control to user.
+        scrap_tools.switchTab(context.driver, Tab.Magzter)
+        with deadline.paused():
+            otpByUser: str = input("Write OTP: ")
+        # Step deadline may be already expired here. So, the default wait time is used.
+        context.mg.writeOTP(otpByUser, maxWaitTime)
+
+    # Card information is submitted in this step. So, this step and all later steps are never aborted on
+    # row deadline (payment must always be confirmed by the user and recorded).
+    @rowPipeline.step("card_information", timeout=150, abortable=False)
+    def writeCardInformation(context: pipeline.RowContext, deadline: pipeline.Deadline) -> None:
+        logPageLoadStatistics(context.driver, "Magzter checkout")
+        paymentPageLink: str = context.driver.current_url
+        # Stripe page works
         print("Fetching and writing card information...")
-        cardNumber: str = rowData[headersWithIndex["card_number"]]
-        cardExpiry: str = rowData[headersWithIndex["card_expiry"]]
-        cardCvv: str = rowData[headersWithIndex["card_cvv"]]
-        cardholderName: str = rowData[headersWithIndex["cardholder_name"]]
-
-        uDriver = NewUndetectableDriverInstance.getNewChromeInstance()
-        uDriver.get(paymentPageLink)
-        stp = stripe.Stripe(uDriver)
-        sleep(3)
-        if not stp.isCorrectEmailOnPaymentPage(email.lower()):
+        row: google_sheets.RowRecord = context.row
+
+        context.uDriver = NewUndetectableDriverInstance.getNewChromeInstance()
+        context.uDriver.get(paymentPageLink)
+        stp = stripe.Stripe(context.uDriver)
+        if not stp.isCorrectEmailOnPaymentPage(row.microsoft_email.lower(), deadline.remaining(maxWaitTime)):
             print("Email on the page is not same as the email logged in.")
             print("Something went wrong.. Error Code: ")
             print("Please don't proceed. Close the application...")
-            input("Press enter to continue (Not recommended): ")
-
-        stp.writeCardInformation(cardNumber, cardExpiry, cardCvv, cardholderName)
+            with deadline.paused():
+                input("Press enter to continue (Not recommended): ")
+
+        stp.writeCardInformation(
+            row.card_number,
+            row.card_expiry,
+            row.card_cvv,
+            row.cardholder_name,
+            deadline.remaining(maxWaitTime),
+        )
         print("Card Information written..")
 
         print("Writing reference IDs...")
-        corporateId: str = rowData[headersWithIndex["corporate"]]
-        employeeId: str = rowData[headersWithIndex["employee_id"]]
-        stp.writeUniqueReferenceIDLikeHuman(corporateId, employeeId)
+        stp.writeUniqueReferenceIDLikeHuman(
+            row.corporate, row.employee_id, maxWaitTimeForFormLoad=deadline.remaining(60)
+        )
         print("If reference IDs are not written then copy and paste from here..")
-        print(f"Corporate ID: {corporateId}")
-        print(f"Employee ID: {employeeId}")
+        print(f"Corporate ID: {row.corporate}")
+        print(f"Employee ID: {row.employee_id}")
         print("done...")
 
+    @rowPipeline.step("payment_confirmation", interactive=True)
+    def paymentConfirmation(context: pipeline.RowContext, deadline: pipeline.Deadline) -> None:
         print("\n")
-        print(f"Time taken till this point for row {rowNumber} is {time()-iterationStartTime:.2f} seconds.")
+        print(
+            f"Time taken till this point for row {context.rowNumber} is {context.deadline.elapsed():.2f} seconds."
+        )
         print("\n")
-        paymentStatus = confirmPaymentStatus()
-        paymentStatus = "Success" if paymentStatus else "Failed"
+        context.paymentStatus = "Success" if confirmPaymentStatus() else "Failed"
 
-        # TODO -> Updating the current row of google sheet with new desired information
+    @rowPipeline.step("sheet_update", timeout=60, retries=3, retryDelay=5)
+    def updateSheet(context: pipeline.RowContext, deadline: pipeline.Deadline) -> None:
+        # Updating the current row of google sheet with new desired information
         print("Updating the current row of google sheet with new desired information")
+        rowNumber: int = context.rowNumber
         cellValueDict: dict = {
-            f"{headersWithColumn['ip']}{rowNumber}": currentIP,
+            f"{headersWithColumn['ip']}{rowNumber}": context.currentIP,
             f"{headersWithColumn['ip_same_check']}{rowNumber}": "False",
-            f"{headersWithColumn['status']}{rowNumber}": paymentStatus,
+            f"{headersWithColumn['status']}{rowNumber}": context.paymentStatus,
         }
         gs.updateMultipleCells(cellValueDict)
 
-        # TODO -> Updating the last success stat file
+    @rowPipeline.step("checkpoint", timeout=30, retries=1, retryDelay=1)
+    def checkpoint(context: pipeline.RowContext, deadline: pipeline.Deadline) -> None:
+        # Updating the last success stat file
         createLastSuccessStatJSONFile(
-            spreadSheetName, sheetName, currentIP, rowNumber, lastSuccessStatFilePath=lastSuccessStatFilePath
+            spreadSheetName,
+            sheetName,
+            context.currentIP,
+            context.rowNumber,
+            lastSuccessStatFilePath=lastSuccessStatFilePath,
         )
 
-        # TODO -> Inserting the current ip to the database.
+        # Inserting the current ip to the database.
         print("Inserting the current ip to the database...")
-        spreadsheetDb.insertIp(currentIP)
+        spreadsheetDb.insertIp(context.currentIP)
+
+    return rowPipeline
+
+
+def main() -> None:
+    # *********************************Scraping Objects & Variables*********************************
+    spreadSheetName, sheetName, gs = performInitialSpreadsheetOperations()  # gs is a GoogleSheets object
+
+    lastSuccessStatFilePath: str = settings["app"]["last_success_stat_file"]
+    headersWithColumn: dict = settings["spreadsheet"]["headers_with_column"]
+
+    spreadsheetDb = spreadsheet_db.Spreadsheet(spreadSheetName, sheetName)
+    rowPipeline: pipeline.Pipeline = buildRowPipeline(
+        gs, spreadsheetDb, spreadSheetName, sheetName, lastSuccessStatFilePath
+    )
+
+    # Throughput and ETA estimator (warm started from the last run if statistics file exists)
+    throughputSettings: dict = settings["throughput"]
+    throughputEstimator = throughput.ThroughputEstimator(
+        settings["app"]["throughput_stat_file"],
+        smoothingFactor=throughputSettings["smoothing_factor"],
+        trendSmoothingFactor=throughputSettings["trend_smoothing_factor"],
+        outlierTrimFactor=throughputSettings["outlier_trim_factor"],
+    )
+
+    # Scraping Starts
+    # *************************************Scraping Starts*************************************
 
-        iterationEndTime: float = time()
-        print(f"Total time for row {rowNumber} is {iterationEndTime-iterationStartTime:.2f} seconds.")
+    # TODO -> Fetching desired row number to start and data of the respective row from the Google sheet
+    rowNumber: int = fetchRowNumberToStart(spreadSheetName, sheetName, lastSuccessStatFilePath)
 
-        # Updating the row number and index
+    # Last row of data (using serial number column). Used to find the number of remaining rows.
+    lastRowNumber: int = gs.getLastFilledRowNumber(ord(headersWithColumn["sno"]) - ord("A") + 1)
+    print(throughputEstimator.getSummary(lastRowNumber - rowNumber + 1))
+
+    while True:
+        print(f"\n\n======================== FOR ROW NUMBER {rowNumber} ========================")
+        context: pipeline.RowContext = rowPipeline.newContext(rowNumber)
+        try:
+            rowPipeline.run(context)
+        except pipeline.StopPipeline:
+            # All rows have been processed
+            break
+        except pipeline.PipelineError as e:
+            # Row is aborted (invalid row), failed (all attempts) or exceeded its deadline
+            print(f"Row {rowNumber} is aborted. Error Code: 1107")
+            print("Exception:", e)
+            logging.error(f"Row {rowNumber}: {e} | {rowPipeline.getTimingsSummary(context.timings)}")
+            if not confirmSkipAbortedRow():
+                break
+            # Skipped row is not counted in the throughput.
+            logging.warning(f"Row {rowNumber} is skipped by the user.")
+            rowNumber += 1
+            continue
+        finally:
+            if context.driver is not None:
+                cacheStatistics: dict = scrap_tools.getElementCacheStatistics(context.driver)
+                logging.info(f"Row {rowNumber} element cache: {cacheStatistics}")
+            # Closing the browsers
+            print("Closing both browsers till then please change your IP.")
+            quitBrowsers(context)
+
+        rowDuration: float = context.deadline.elapsed()
+        print(f"Total time for row {rowNumber} is {rowDuration:.2f} seconds.")
+        timingsSummary: str = rowPipeline.getTimingsSummary(context.timings)
+        print(f"Step timings: {timingsSummary}")
+        logging.info(f"Row {rowNumber} steps: {timingsSummary}")
+
+        # Updating throughput and ETA of the remaining rows
+        throughputEstimator.addRowDuration(rowDuration)
+        throughputEstimator.save()
+        if lastRowNumber <= rowNumber:
+            # Rows may be appended (or serial number may be missing in the last rows). So, reading it again.
+            lastRowNumber = gs.getLastFilledRowNumber(ord(headersWithColumn["sno"]) - ord("A") + 1)
+        throughputSummary: str = throughputEstimator.getSummary(lastRowNumber - rowNumber)
+        print(throughputSummary)
+        logging.info(f"Row {rowNumber}: {throughputSummary}")
+
+        # Updating the row number
         rowNumber += 1  # incrementing the row number
-        index += 1
 
-        # Closing the browser
-        print("Closing both browsers till then please change your IP.")
-        # Ensure that chrome.quit() is called regardless of what happens.
-        driver.quit()
-        uDriver.quit()
+    if rowPipeline.statistics:
+        print("\n======================== Step timings (slowest first) ========================")
+        print(rowPipeline.getStatisticsSummary())
 
 
 if __name__ == "__main__":
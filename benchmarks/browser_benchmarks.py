@@ -0,0 +1,273 @@
+"""
+    @file: benchmarks/browser_benchmarks.py
+    @author: Suraj Kumar Giri (https://github.com/surajgirioffl)
+    @init-date: 19th Oct 2026
+    @completed-on: N/A
+    @last-modified: 19th Oct 2026
+    @error-series: 5300
+    @description:
+        * Module to benchmark the browser-side code (scrap_tools wait helpers, Microsoft and Magzter components) offline.
+        * Fixture pages are served from a local HTTP server and driven by headless Firefox. No network is required.
+        * Usage (from the root directory of the project):
+            - python -m benchmarks.browser_benchmarks
+            - python -m benchmarks.browser_benchmarks --iterations 20 --delay 300 --mails 10 100 1000 --output report.json
+            - python -m benchmarks.browser_benchmarks --suite microsoft --redirects 3
+"""
+
+__author__ = "Suraj Kumar Giri"
+__email__ = "surajgirioffl@gmail.com"
+
+import argparse
+from typing import Callable
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver import Firefox
+from utilities import scrap_tools
+from components import microsoft, magzter
+from benchmarks.fixture_server import FixtureServer
+from benchmarks import reporting
+
+# Benchmark name -> (setup, function)
+Benchmarks = dict[str, tuple[Callable[[], object] | None, Callable[[], object]]]
+
+EMAIL: str = "someone@outlook.com"
+PASSWORD: str = "password"
+OTP: str = "1234"
+
+
+def getHeadlessFirefoxInstance(headless: bool = True) -> Firefox:
+    """
+    Description:
+        - Function to get a new Firefox instance to run the benchmarks.
+
+    Args:
+        * headless (bool, optional):
+            - Whether to run Firefox in headless mode.
+            - Defaults to True.
+
+    Returns:
+        * Firefox:
+            - The Firefox driver instance.
+    """
+    firefoxOptions = webdriver.firefox.options.Options()
+    if headless:
+        firefoxOptions.add_argument("--headless")
+    return webdriver.Firefox(options=firefoxOptions)
+
+
+def expect(actual: object, expected: object, what: str) -> None:
+    # A benchmark of a broken flow is meaningless. So, validate the result of each iteration.
+    if actual != expected:
+        raise AssertionError(f"Unexpected {what}: {actual!r} (expected {expected!r})")
+
+
+def getWaitHelperBenchmarks(
+    driver: Firefox, server: FixtureServer, delay: int, redirects: int = 0
+) -> Benchmarks:
+    """
+    Description:
+        - Function to get the benchmarks of the wait helpers of scrap_tools.
+        - Element is added to DOM after 'delay', becomes visible after 2 * 'delay' and clickable after 3 * 'delay'.
+        - URL changes after 'delay' (to a different host, required by the manual URL wait).
+        - Pages are served after 'redirects' HTTP redirects (landing page is not redirected, its URL is matched exactly).
+    """
+    locator: tuple = (By.ID, "target")
+    elementPageURL: str = server.url(
+        "/wait/element", delay=delay, visible_delay=delay, clickable_delay=delay, redirects=redirects
+    )
+    landingURL: str = server.url("/wait/landing", host="localhost")
+    urlPageURL: str = server.url("/wait/url", delay=delay, next=landingURL, redirects=redirects)
+    # URL of the page after all redirects (server only decrements 'redirects' in the query)
+    loadedURLPageURL: str = server.url("/wait/url", delay=delay, next=landingURL, redirects=0)
+
+    def loadElementPage() -> None:
+        driver.get(elementPageURL)
+
+    def loadURLPage() -> None:
+        driver.get(urlPageURL)
+
+    return {
+        "waitUntilElementLoadedInDOM": (
+            loadElementPage,
+            lambda: scrap_tools.waitUntilElementLoadedInDOM(driver, locator),
+        ),
+        "waitUntilElementBecomeVisible": (
+            loadElementPage,
+            lambda: scrap_tools.waitUntilElementBecomeVisible(driver, locator),
+        ),
+        "waitUntilElementBecomeClickable": (
+            loadElementPage,
+            lambda: scrap_tools.waitUntilElementBecomeClickable(driver, locator),
+        ),
+        "waitUntilCurrentURLContainsExpectedURLFragment": (
+            loadURLPage,
+            lambda: scrap_tools.waitUntilCurrentURLContainsExpectedURLFragment(driver, "/wait/landing"),
+        ),
+        "waitUntilCurrentURLContainsExpectedURLFragment_Manual": (
+            loadURLPage,
+            lambda: scrap_tools.waitUntilCurrentURLContainsExpectedURLFragment_Manual(driver, "localhost"),
+        ),
+        "waitUntilCurrentURLExactMatchToExpectedURL": (
+            loadURLPage,
+            lambda: scrap_tools.waitUntilCurrentURLExactMatchToExpectedURL(driver, landingURL),
+        ),
+        "waitUntilCurrentURLMatchToExpectedURLRegexPattern": (
+            loadURLPage,
+            lambda: scrap_tools.waitUntilCurrentURLMatchToExpectedURLRegexPattern(driver, r"/wait/landing$"),
+        ),
+        "waitUntilCurrentURLDifferentFromExpectedURL": (
+            loadURLPage,
+            lambda: scrap_tools.waitUntilCurrentURLDifferentFromExpectedURL(driver, loadedURLPageURL),
+        ),
+    }
+
+
+def getMicrosoftBenchmarks(
+    driver: Firefox,
+    server: FixtureServer,
+    delay: int,
+    stepDelay: int,
+    mailCounts: list[int],
+    redirects: int = 0,
+) -> Benchmarks:
+    """
+    Description:
+        - Function to get the benchmarks of the methods of the Microsoft component.
+        - fetchOTP() is benchmarked for each mail count (number of mails in the mail list).
+        - Pages are served after 'redirects' HTTP redirects.
+    """
+    ms = microsoft.Microsoft(driver)
+    loginURL: str = server.url("/microsoft/login", delay=delay, step_delay=stepDelay, redirects=redirects)
+    signInURL: str = server.url("/outlook/signin", delay=delay, step_delay=stepDelay, redirects=redirects)
+
+    def loadBlankPage() -> None:
+        driver.get("about:blank")
+
+    benchmarks: Benchmarks = {
+        "Microsoft.login": (loadBlankPage, lambda: ms.login(loginURL, EMAIL, PASSWORD)),
+        "Microsoft.openOutlook": (loadBlankPage, lambda: ms.openOutlook(signInURL)),
+    }
+    for mails in mailCounts:
+        # Magzter mail is the last one. So, whole list is scanned.
+        mailURL: str = server.url(
+            "/outlook/mail", delay=delay, mails=mails, otp=OTP, otp_position=mails - 1, redirects=redirects
+        )
+        benchmarks[f"Microsoft.fetchOTP[mails={mails}]"] = (
+            lambda url=mailURL: driver.get(url),
+            lambda: expect(ms.fetchOTP(), OTP, "OTP"),
+        )
+    return benchmarks
+
+
+def getMagzterBenchmarks(
+    driver: Firefox, server: FixtureServer, delay: int, stepDelay: int, otpWaitTime: int, redirects: int = 0
+) -> Benchmarks:
+    """
+    Description:
+        - Function to get the benchmarks of the methods of the Magzter component.
+        - OTP verification is benchmarked for both valid OTP (redirect to checkout) and invalid OTP (error message).
+        - Pages are served after 'redirects' HTTP redirects.
+    """
+    mg = magzter.Magzter(driver)
+    loginURL: str = server.url("/magzter/login", delay=delay, step_delay=stepDelay, redirects=redirects)
+    verifyURL: str = server.url(
+        "/magzter/verify", delay=delay, step_delay=stepDelay, otp=OTP, redirects=redirects
+    )
+
+    def loadBlankPage() -> None:
+        driver.get("about:blank")
+
+    def loadVerifyPage() -> None:
+        driver.get(verifyURL)
+
+    def verifyOTP(otp: str, expectedStatus: bool | None) -> None:
+        mg.writeOTP(otp)
+        expect(
+            mg.isOTPSuccessfullySubmitted(maxWaitTimeForURLChange=otpWaitTime), expectedStatus, "OTP status"
+        )
+
+    return {
+        "Magzter.login": (loadBlankPage, lambda: mg.login(loginURL, EMAIL)),
+        "Magzter.writeOTP": (loadVerifyPage, lambda: mg.writeOTP(OTP)),
+        "Magzter.verifyOTP[valid]": (loadVerifyPage, lambda: verifyOTP(OTP, True)),
+        "Magzter.verifyOTP[invalid]": (loadVerifyPage, lambda: verifyOTP("0000", None)),
+    }
+
+
+def runBenchmarks(benchmarks: Benchmarks, iterations: int) -> dict[str, dict[str, float]]:
+    """
+    Description:
+        - Function to run the benchmarks and summarize the latencies.
+        - A failed benchmark is reported as failed and doesn't stop the other benchmarks.
+    """
+    results: dict[str, dict[str, float]] = {}
+    for name, (setup, function) in benchmarks.items():
+        print(f"Running {name}...")
+        try:
+            results[name] = reporting.summarize(reporting.measure(function, iterations, setup))
+        except Exception as e:
+            print(f"Benchmark {name} failed. Error Code: 5301")
+            print("Exception:", e)
+            results[name] = reporting.summarize([])
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline benchmarks of the browser-side code.")
+    parser.add_argument("--iterations", type=int, default=10, help="Iterations of each benchmark.")
+    parser.add_argument("--delay", type=int, default=200, help="Render delay of the pages (ms).")
+    parser.add_argument(
+        "--step-delay", type=int, default=100, help="Delay between a click and the reaction (ms)."
+    )
+    parser.add_argument(
+        "--mails", type=int, nargs="+", default=[10, 100, 1000], help="Mail counts of mail list."
+    )
+    parser.add_argument(
+        "--otp-wait", type=int, default=5, help="maxWaitTimeForURLChange of the OTP check (s)."
+    )
+    parser.add_argument(
+        "--redirects",
+        type=int,
+        default=0,
+        help="HTTP redirects before serving each page (simulates redirect chains).",
+    )
+    parser.add_argument("--suite", choices=["all", "scrap_tools", "microsoft", "magzter"], default="all")
+    parser.add_argument("--headed", action="store_true", help="Run Firefox with GUI.")
+    parser.add_argument("--output", help="Path of the JSON file to save the report.")
+    args = parser.parse_args()
+
+    with FixtureServer() as server:
+        driver: Firefox = getHeadlessFirefoxInstance(headless=not args.headed)
+        try:
+            results: dict[str, dict[str, float]] = {}
+            if args.suite in ("all", "scrap_tools"):
+                results |= runBenchmarks(
+                    getWaitHelperBenchmarks(driver, server, args.delay, args.redirects), args.iterations
+                )
+            if args.suite in ("all", "microsoft"):
+                results |= runBenchmarks(
+                    getMicrosoftBenchmarks(
+                        driver, server, args.delay, args.step_delay, args.mails, args.redirects
+                    ),
+                    args.iterations,
+                )
+            if args.suite in ("all", "magzter"):
+                results |= runBenchmarks(
+                    getMagzterBenchmarks(
+                        driver, server, args.delay, args.step_delay, args.otp_wait, args.redirects
+                    ),
+                    args.iterations,
+                )
+        finally:
+            driver.quit()
+
+    reporting.printReport(
+        f"Browser benchmarks (delay={args.delay}ms, step delay={args.step_delay}ms, redirects={args.redirects})",
+        results,
+    )
+    if args.output and reporting.saveReport(results, args.output):
+        print(f"\nReport saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
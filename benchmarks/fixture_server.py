@@ -0,0 +1,263 @@
+"""
+    @file: benchmarks/fixture_server.py
+    @author: Suraj Kumar Giri (https://github.com/surajgirioffl)
+    @init-date: 19th Oct 2026
+    @completed-on: N/A
+    @last-modified: 19th Oct 2026
+    @error-series: 5100
+    @description:
+        * Module to serve static fixture pages (imitating Microsoft, Outlook and Magzter pages) from a local HTTP server.
+        * Used by the benchmarks to measure the browser-side code without network and without the real sites.
+
+    @query-parameters (supported by every page):
+        * delay: Render delay in milliseconds (content is rendered by javascript after this delay).
+        * step_delay: Delay in milliseconds between a click and the reaction of the page (next step or redirect).
+        * latency: Server side delay in milliseconds before sending the response.
+        * redirects: Number of HTTP (302) redirects before serving the page.
+"""
+
+__author__ = "Suraj Kumar Giri"
+__email__ = "surajgirioffl@gmail.com"
+
+import json
+import html
+from time import sleep
+from os.path import dirname, join
+from string import Template
+from threading import Thread
+from urllib.parse import urlencode, urlsplit, parse_qsl
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+FIXTURES_DIRECTORY: str = join(dirname(__file__), "fixtures")
+
+# Query parameters carried over to the next page of a flow.
+CARRIED_PARAMETERS: tuple[str, ...] = ("delay", "step_delay", "latency")
+
+
+def loadTemplate(fixtureName: str) -> Template:
+    """
+    Description:
+        - Function to load a fixture page as template.
+
+    Args:
+        * fixtureName (str):
+            - Name of the fixture file (without extension) in the fixtures directory.
+
+    Returns:
+        * Template:
+            - The template of the fixture page.
+    """
+    with open(join(FIXTURES_DIRECTORY, f"{fixtureName}.html"), "r", encoding="utf-8") as file:
+        return Template(file.read())
+
+
+def buildMailList(mails: int, otp: str, otpPosition: int) -> str:
+    """
+    Description:
+        - Function to build the HTML of the mail list of Outlook.
+
+    Args:
+        * mails (int):
+            - Number of mails in the list.
+        * otp (str):
+            - OTP to write in the Magzter mail.
+        * otpPosition (int):
+            - Position (index) of the Magzter mail in the list. Negative value means no Magzter mail.
+
+    Returns:
+        * str:
+            - HTML of the mails.
+    """
+    mailsHTML: list[str] = []
+    for index in range(mails):
+        if index == otpPosition:
+            sender, subject = "Magzter", f"{otp} is your OTP to authenticate your email"
+        else:
+            sender, subject = f"Sender {index}", f"Newsletter number {index} of this week"
+        mailsHTML.append(f'<div class="mail"><div>{sender}</div><div>{subject}</div></div>')
+    return "\n".join(mailsHTML)
+
+
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+    """
+    Description:
+        - Request handler to serve the fixture pages.
+    """
+
+    # Path -> fixture name (file name without extension in the fixtures directory)
+    routes: dict[str, str] = {
+        "/microsoft/login": "microsoft_login",
+        "/microsoft/done": "landing",
+        "/outlook/signin": "outlook_signin",
+        "/outlook/mail": "outlook_mail",
+        "/magzter/login": "magzter_login",
+        "/magzter/verify": "magzter_verify",
+        "/checkout": "checkout",
+        "/wait/element": "wait_element",
+        "/wait/url": "wait_url",
+        "/wait/landing": "landing",
+    }
+
+    templates: dict[str, Template] = {}
+
+    def log_message(self, format: str, *args) -> None:
+        # Silencing the default logging of each request (It will disturb the report of benchmarks).
+        pass
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        query: dict[str, str] = dict(parse_qsl(url.query))
+
+        if query.get("latency"):
+            sleep(int(query["latency"]) / 1000)
+
+        redirects: int = int(query.get("redirects", 0))
+        if redirects > 0:
+            query["redirects"] = str(redirects - 1)
+            self.send_response(302)
+            self.send_header("Location", f"{url.path}?{urlencode(query)}")
+            self.end_headers()
+            return
+
+        fixtureName: str | None = self.routes.get(url.path)
+        if fixtureName is None:
+            self.send_error(404)
+            return
+
+        if fixtureName not in self.templates:
+            self.templates[fixtureName] = loadTemplate(fixtureName)
+
+        body: bytes = self.templates[fixtureName].substitute(self.getValues(url.path, query)).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    @staticmethod
+    def getNextURL(path: str, query: dict[str, str], **parameters) -> str:
+        # Carrying over the delays of the current page to the next page of the flow.
+        nextQuery: dict[str, str] = {key: query[key] for key in CARRIED_PARAMETERS if key in query}
+        nextQuery.update({key: str(value) for key, value in parameters.items()})
+        return f"{path}?{urlencode(nextQuery)}" if nextQuery else path
+
+    def getValues(self, path: str, query: dict[str, str]) -> dict[str, str]:
+        """
+        Description:
+            - Method to get the values of placeholders of the fixture page from the query parameters.
+            - Values used inside javascript are JSON encoded and values used inside HTML attributes are escaped.
+        """
+        values: dict[str, str] = {
+            "delay": str(int(query.get("delay", 0))),
+            "step_delay": str(int(query.get("step_delay", 0))),
+        }
+        otp: str = query.get("otp", "1234")
+
+        if path == "/microsoft/login":
+            values["next"] = json.dumps(query.get("next", self.getNextURL("/microsoft/done", query)))
+        elif path == "/outlook/signin":
+            mailQuery: dict[str, str] = {
+                key: query[key] for key in ("mails", "otp", "otp_position") if key in query
+            }
+            values["href"] = html.escape(self.getNextURL("/outlook/mail", query, **mailQuery), quote=True)
+        elif path == "/outlook/mail":
+            values["mails"] = buildMailList(
+                int(query.get("mails", 20)), html.escape(otp), int(query.get("otp_position", 0))
+            )
+        elif path == "/magzter/login":
+            values["next"] = json.dumps(self.getNextURL("/magzter/verify", query, otp=otp))
+        elif path == "/magzter/verify":
+            values["otp"] = json.dumps(otp)
+            values["next"] = json.dumps(self.getNextURL("/checkout", query))
+        elif path == "/checkout":
+            values["email"] = html.escape(query.get("email", ""), quote=True)
+        elif path == "/wait/element":
+            values["visible_delay"] = str(int(query.get("visible_delay", 0)))
+            values["clickable_delay"] = str(int(query.get("clickable_delay", 0)))
+        elif path == "/wait/url":
+            values["next"] = json.dumps(query.get("next", "/wait/landing"))
+        return values
+
+
+class FixtureServer:
+    """
+    Description:
+        - Class to run the local HTTP server of the fixture pages in a background thread.
+
+    Usage:
+        with FixtureServer() as server:
+            driver.get(server.url("/microsoft/login", delay=200))
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """
+        Description:
+            - Initializes a new instance of the class.
+
+        Args:
+            * host (str, optional):
+                - Host to bind the server.
+                - Defaults to "127.0.0.1".
+            * port (int, optional):
+                - Port to bind the server. 0 means any free port.
+                - Defaults to 0.
+
+        Returns:
+            * None
+        """
+        self.httpServer = ThreadingHTTPServer((host, port), FixtureRequestHandler)
+        self.httpServer.daemon_threads = True
+        self.host, self.port = self.httpServer.server_address[:2]
+        self.thread = Thread(target=self.httpServer.serve_forever, daemon=True)
+
+    def __enter__(self) -> "FixtureServer":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Description:
+            - Method to start the server in a background thread.
+        """
+        self.thread.start()
+
+    def stop(self) -> None:
+        """
+        Description:
+            - Method to stop the server.
+        """
+        self.httpServer.shutdown()
+        self.httpServer.server_close()
+
+    def url(self, path: str, host: str | None = None, **parameters) -> str:
+        """
+        Description:
+            - Method to get the absolute URL of a fixture page.
+
+        Args:
+            * path (str):
+                - Path of the page. E.g: "/microsoft/login"
+            * host (str | None, optional):
+                - Host to use in the URL instead of the bound host (E.g: "localhost" to get a different host for the same server).
+                - Defaults to None.
+            * **parameters:
+                - Query parameters of the page. E.g: delay=200, mails=50
+
+        Returns:
+            * str:
+                - The absolute URL.
+        """
+        query: str = urlencode({key: str(value) for key, value in parameters.items()})
+        return f"http://{host or self.host}:{self.port}{path}" + (f"?{query}" if query else "")
+
+
+if __name__ == "__main__":
+    with FixtureServer(port=8000) as server:
+        print(f"Serving fixture pages on {server.url('/')}")
+        for path in FixtureRequestHandler.routes:
+            print(server.url(path))
+        input("Press Enter to stop the server...")
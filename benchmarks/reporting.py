@@ -0,0 +1,137 @@
+"""
+    @file: benchmarks/reporting.py
+    @author: Suraj Kumar Giri (https://github.com/surajgirioffl)
+    @init-date: 19th Oct 2026
+    @completed-on: N/A
+    @last-modified: 19th Oct 2026
+    @error-series: 5200
+    @description:
+        * Module to measure latencies of the benchmarks and report their distributions.
+"""
+
+__author__ = "Suraj Kumar Giri"
+__email__ = "surajgirioffl@gmail.com"
+
+import json
+from time import perf_counter
+from statistics import mean, quantiles, stdev
+from typing import Callable
+
+
+def measure(
+    function: Callable[[], object], iterations: int, setup: Callable[[], object] | None = None
+) -> list[float]:
+    """
+    Description:
+        - Function to measure the latency of a function for the specified number of iterations.
+        - Setup (if any) is called before each iteration and is not measured.
+
+    Args:
+        * function (Callable[[], object]):
+            - The function to measure.
+        * iterations (int):
+            - Number of iterations.
+        * setup (Callable[[], object] | None, optional):
+            - Function to call before each iteration (E.g: loading the fixture page).
+            - Defaults to None.
+
+    Returns:
+        * list[float]:
+            - Latency of each iteration in milliseconds.
+    """
+    latencies: list[float] = []
+    for _ in range(iterations):
+        if setup is not None:
+            setup()
+        startTime: float = perf_counter()
+        function()
+        latencies.append((perf_counter() - startTime) * 1000)
+    return latencies
+
+
+def summarize(latencies: list[float]) -> dict[str, float]:
+    """
+    Description:
+        - Function to summarize the distribution of latencies.
+
+    Args:
+        * latencies (list[float]):
+            - Latencies in milliseconds.
+
+    Returns:
+        * dict[str, float]:
+            - Dictionary containing count, min, mean, p50, p90, p99, max and stdev (in milliseconds).
+    """
+    if not latencies:
+        return {"count": 0}
+    if len(latencies) > 1:
+        percentiles: list[float] = quantiles(latencies, n=100, method="inclusive")
+        p50, p90, p99 = percentiles[49], percentiles[89], percentiles[98]
+        deviation: float = stdev(latencies)
+    else:
+        p50 = p90 = p99 = latencies[0]
+        deviation = 0.0
+    return {
+        "count": len(latencies),
+        "min": min(latencies),
+        "mean": mean(latencies),
+        "p50": p50,
+        "p90": p90,
+        "p99": p99,
+        "max": max(latencies),
+        "stdev": deviation,
+    }
+
+
+def printReport(title: str, results: dict[str, dict[str, float]]) -> None:
+    """
+    Description:
+        - Function to print the summaries of the benchmarks as a table.
+
+    Args:
+        * title (str):
+            - Title of the report.
+        * results (dict[str, dict[str, float]]):
+            - Benchmark name -> summary (as returned by summarize()).
+
+    Returns:
+        * None
+    """
+    columns: tuple[str, ...] = ("min", "mean", "p50", "p90", "p99", "max", "stdev")
+    nameWidth: int = max([len("benchmark")] + [len(name) for name in results])
+    print(f"\n======================== {title} (latency in ms) ========================")
+    print(f"{'benchmark':<{nameWidth}}  {'count':>5}  " + "  ".join(f"{column:>9}" for column in columns))
+    for name, summary in results.items():
+        if not summary.get("count"):
+            print(f"{name:<{nameWidth}}  {0:>5}  (failed)")
+            continue
+        print(
+            f"{name:<{nameWidth}}  {summary['count']:>5}  "
+            + "  ".join(f"{summary[column]:>9.2f}" for column in columns)
+        )
+
+
+def saveReport(results: dict[str, dict[str, float]], filePath: str) -> bool:
+    """
+    Description:
+        - Function to save the summaries of the benchmarks as JSON (to compare different runs).
+
+    Args:
+        * results (dict[str, dict[str, float]]):
+            - Benchmark name -> summary (as returned by summarize()).
+        * filePath (str):
+            - Path of the JSON file.
+
+    Returns:
+        * bool:
+            - True if the report is saved successfully, False otherwise.
+    """
+    try:
+        with open(filePath, "w") as file:
+            json.dump(results, file, indent=2)
+    except Exception as e:
+        print("Unable to save the benchmark report. Error Code: 5201")
+        print("Exception:", e)
+        return False
+    else:
+        return True
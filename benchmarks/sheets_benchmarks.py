@@ -0,0 +1,200 @@
+"""
+    @file: benchmarks/sheets_benchmarks.py
+    @author: Suraj Kumar Giri (https://github.com/surajgirioffl)
+    @init-date: 19th Oct 2026
+    @completed-on: N/A
+    @last-modified: 19th Oct 2026
+    @error-series: 5400
+    @description:
+        * Module to benchmark the Sheets I/O of GoogleSheets offline using the in-memory fake backend.
+        * Reads N rows and writes M updates (3 cells per row like main()) under each strategy.
+        * Latency, quota windows and backoff run on a virtual clock. So, the simulated time is repeatable and no real waiting is done.
+        * Usage (from the root directory of the project):
+            - python -m benchmarks.sheets_benchmarks
+            - python -m benchmarks.sheets_benchmarks --rows 200 --updates 50 --latency 0.3 --quota 60 --error-rate 0.02
+"""
+
+__author__ = "Suraj Kumar Giri"
+__email__ = "surajgirioffl@gmail.com"
+
+import argparse
+from time import perf_counter
+from typing import Callable
+from gspread.exceptions import APIError
+from components.google_sheets import GoogleSheets
+from components.sheets_backend import FakeSpreadsheet, VirtualClock
+from benchmarks import reporting
+
+HEADERS: list[str] = ["sno", "date", "ip", "microsoft_email", "password", "magzter_email", "card_number"]
+
+# Columns updated by main() for each row (ip, ip_same_check, status)
+UPDATED_COLUMNS: tuple[str, ...] = ("C", "N", "Q")
+
+DATA_START_ROW: int = 2
+
+# Strategy name -> function(GoogleSheets, count)
+Strategies = dict[str, Callable[[GoogleSheets, int], object]]
+
+
+def buildRows(rows: int) -> list[list[str]]:
+    """
+    Description:
+        - Function to build the rows of the fake worksheet (header row + data rows, like the real sheet).
+    """
+    data: list[list[str]] = [HEADERS]
+    for index in range(1, rows + 1):
+        data.append(
+            [str(index), "", "", f"user{index}@outlook.com", "password", "", f"4242424242424{index:03d}"]
+        )
+    return data
+
+
+def withBackoff(clock: VirtualClock, maxRetries: int = 8) -> Callable[[Callable[[], object]], object]:
+    """
+    Description:
+        - Function to get a caller which retries a request on 429 with exponential backoff (on the virtual clock).
+        - Same as what a caller of GoogleSheets must do to survive the quota.
+    """
+
+    def call(request: Callable[[], object]) -> object:
+        for attempt in range(maxRetries + 1):
+            try:
+                return request()
+            except APIError as e:
+                if e.response.status_code != 429 or attempt == maxRetries:
+                    raise
+                clock.sleep(min(2**attempt, 64))
+
+    return call
+
+
+def getReadStrategies(clock: VirtualClock, chunkSize: int) -> Strategies:
+    call = withBackoff(clock)
+
+    def readRowByRow(gs: GoogleSheets, rows: int) -> None:
+        for rowIndex in range(DATA_START_ROW, DATA_START_ROW + rows):
+            call(lambda: gs.getRowValues(rowIndex))
+
+    def readInChunks(gs: GoogleSheets, rows: int) -> None:
+        for startRowIndex in range(DATA_START_ROW, DATA_START_ROW + rows, chunkSize):
+            endRowIndex: int = min(startRowIndex + chunkSize, DATA_START_ROW + rows) - 1
+            call(lambda: gs.getMultipleRowValues(startRowIndex, endRowIndex))
+
+    def readInSingleBlock(gs: GoogleSheets, rows: int) -> None:
+        call(lambda: gs.getMultipleRowValues(DATA_START_ROW, DATA_START_ROW + rows - 1))
+
+    return {
+        "read: row_values per row": readRowByRow,
+        f"read: batch_get chunks of {chunkSize}": readInChunks,
+        "read: batch_get single block": readInSingleBlock,
+    }
+
+
+def getWriteStrategies(clock: VirtualClock) -> Strategies:
+    call = withBackoff(clock)
+
+    def getCellValueDict(rowNumber: int) -> dict[str, str]:
+        return {f"{column}{rowNumber}": "value" for column in UPDATED_COLUMNS}
+
+    def writeCellByCell(gs: GoogleSheets, updates: int) -> None:
+        for rowNumber in range(DATA_START_ROW, DATA_START_ROW + updates):
+            for cell, value in getCellValueDict(rowNumber).items():
+                call(lambda: gs.updateSingleCell(cell, value))
+
+    def writeRowByRow(gs: GoogleSheets, updates: int) -> None:
+        # Current behavior of main()
+        for rowNumber in range(DATA_START_ROW, DATA_START_ROW + updates):
+            call(lambda: gs.updateMultipleCells(getCellValueDict(rowNumber)))
+
+    def writeAllAtOnce(gs: GoogleSheets, updates: int) -> None:
+        cellValueDict: dict[str, str] = {}
+        for rowNumber in range(DATA_START_ROW, DATA_START_ROW + updates):
+            cellValueDict.update(getCellValueDict(rowNumber))
+        call(lambda: gs.updateMultipleCells(cellValueDict))
+
+    return {
+        "write: update_acell per cell": writeCellByCell,
+        "write: batch_update per row": writeRowByRow,
+        "write: batch_update all at once": writeAllAtOnce,
+    }
+
+
+def runStrategy(name: str, count: int, args: argparse.Namespace, seed: int) -> dict:
+    """
+    Description:
+        - Function to run the named strategy once on a fresh fake spreadsheet with its own virtual clock.
+
+    Returns:
+        * dict:
+            - Simulated time (ms), wall time (ms), read/write requests and throttled (429) requests.
+    """
+    clock = VirtualClock()
+    strategies: Strategies = getReadStrategies(clock, args.chunk_size) | getWriteStrategies(clock)
+    spreadsheet = FakeSpreadsheet(
+        worksheets={"Sheet1": buildRows(args.rows)},
+        latency=args.latency,
+        readRequestsPerMinute=args.quota,
+        writeRequestsPerMinute=args.quota,
+        errorRate=args.error_rate,
+        seed=seed,
+        clock=clock,
+    )
+    gs = GoogleSheets("testing", sheetTitleOrIndex=0, spreadsheetBackend=spreadsheet)
+
+    startTime: float = perf_counter()
+    strategies[name](gs, count)
+    wallTime: float = (perf_counter() - startTime) * 1000
+    return {"simulated": clock.time() * 1000, "wall": wallTime, **spreadsheet.requestCounts}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline benchmarks of the Sheets I/O.")
+    parser.add_argument("--rows", type=int, default=100, help="Number of rows to read (N).")
+    parser.add_argument("--updates", type=int, default=100, help="Number of row updates to write (M).")
+    parser.add_argument("--chunk-size", type=int, default=25, help="Rows per request of the chunked read.")
+    parser.add_argument("--latency", type=float, default=0.25, help="Latency of each request (s).")
+    parser.add_argument(
+        "--quota", type=int, default=60, help="Read/write requests per minute (0 = no quota)."
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of an injected 429.")
+    parser.add_argument("--iterations", type=int, default=5, help="Iterations (seeds) of each strategy.")
+    parser.add_argument("--output", help="Path of the JSON file to save the report.")
+    args = parser.parse_args()
+    args.quota = args.quota or None
+
+    # Strategy name -> count (rows to read or updates to write)
+    benchmarks: dict[str, int] = dict.fromkeys(getReadStrategies(VirtualClock(), args.chunk_size), args.rows)
+    benchmarks |= dict.fromkeys(getWriteStrategies(VirtualClock()), args.updates)
+
+    simulatedResults: dict[str, dict[str, float]] = {}
+    wallResults: dict[str, dict[str, float]] = {}
+    requestResults: dict[str, dict[str, float]] = {}
+    for name, count in benchmarks.items():
+        print(f"Running {name}...")
+        runs: list[dict] = [runStrategy(name, count, args, seed) for seed in range(args.iterations)]
+        simulatedResults[name] = reporting.summarize([run["simulated"] for run in runs])
+        wallResults[name] = reporting.summarize([run["wall"] for run in runs])
+        requestResults[name] = {
+            key: sum(run[key] for run in runs) / len(runs) for key in ("read", "write", "throttled")
+        }
+
+    title: str = f"rows={args.rows}, updates={args.updates}, latency={args.latency}s, quota={args.quota}/min"
+    reporting.printReport(f"Sheets I/O simulated time ({title})", simulatedResults)
+    reporting.printReport("Sheets I/O wall time (CPU overhead of the client side)", wallResults)
+
+    print("\n======================== Requests per run (mean) ========================")
+    nameWidth: int = max(len(name) for name in requestResults)
+    print(f"{'benchmark':<{nameWidth}}  {'read':>8}  {'write':>8}  {'429s':>8}")
+    for name, counts in requestResults.items():
+        print(
+            f"{name:<{nameWidth}}  {counts['read']:>8.1f}  {counts['write']:>8.1f}  {counts['throttled']:>8.1f}"
+        )
+
+    if args.output:
+        report: dict = {"simulated": simulatedResults, "wall": wallResults, "requests": requestResults}
+        if reporting.saveReport(report, args.output):
+            print(f"\nReport saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,21 +3,117 @@
     @author: Suraj Kumar Giri (https://github.com/surajgirioffl)
     @init-date: 24th Nov 2023
     @completed-on: N/A
-    @last-modified: 29th Nov 2023
+    @last-modified: 19th Oct 2026
     @error-series: 2200
     @description:
         * Module to perform any operation related to the Google Sheets required for the project.
+        * Rows can be fetched as records (attributes named as headers) instead of index-addressed lists.
 """
 
 __author__ = "Suraj Kumar Giri"
 __email__ = "surajgirioffl@gmail.com"
 
-from typing import Literal, Any
+from typing import Literal, Any, Callable
+from operator import itemgetter
 from sys import exit
 import gspread
 from gspread.utils import ExportFormat
 from gspread.exceptions import APIError, WorksheetNotFound, SpreadsheetNotFound
 from utilities.tools import pressAnyKeyToContinue
+from components.sheets_backend import SpreadsheetBackend
+
+
+class RowRecord:
+    """
+    Description:
+        - Base class of the row records created by RowRecordFactory.
+        - Subclass has one slot for each header. So, values are accessed as attributes (E.g: row.microsoft_email).
+    """
+
+    __slots__ = ("rowNumber",)
+
+    def toDict(self) -> dict[str, str]:
+        """
+        Description:
+            - Method to get the values of the record as dictionary (header -> value).
+        """
+        return {name: getattr(self, name) for name in type(self).__slots__}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rowNumber={self.rowNumber}, {self.toDict()})"
+
+
+class RowRecordFactory:
+    """
+    Description:
+        - Class to build row records (RowRecord) from the values of rows fetched from the worksheet.
+        - Record class and column accessor are built once from the headers. So, building a record is just slicing and assigning.
+    """
+
+    def __init__(self, headersWithIndex: dict[str, int]) -> None:
+        """
+        Description:
+            - Initializes a new instance of the class.
+
+        Args:
+            * headersWithIndex (dict[str, int]):
+                - Header name -> index (starts from 0) of the column. E.g: {"sno": 0, "date": 1, ...}
+                - Header names must be valid identifiers (they become attributes of the records).
+
+        Returns:
+            * None
+
+        Raises:
+            * ValueError:
+                - If headersWithIndex is empty or any header name is not a valid identifier.
+        """
+        if not headersWithIndex:
+            raise ValueError("At least one header is required to build row records.")
+        invalidHeaders: list[str] = [name for name in headersWithIndex if not name.isidentifier()]
+        if invalidHeaders:
+            raise ValueError(f"Header names must be valid identifiers: {invalidHeaders}")
+
+        self.headers: tuple[str, ...] = tuple(headersWithIndex)
+        self.recordClass: type[RowRecord] = type("Row", (RowRecord,), {"__slots__": self.headers})
+        # Slot descriptors of the record class (faster than setattr() by name)
+        self.setters: tuple[Callable, ...] = tuple(
+            getattr(self.recordClass, name).__set__ for name in self.headers
+        )
+        # Precompiled accessor of the columns (in order of the headers)
+        indices: list[int] = list(headersWithIndex.values())
+        self.accessor: Callable[[list], tuple] = (
+            itemgetter(*indices) if len(indices) > 1 else lambda values: (values[indices[0]],)
+        )
+        # Missing trailing cells (empty cells are not returned by the API) are padded with ''
+        self.width: int = max(indices) + 1
+        self.padding: list[str] = [""] * self.width
+
+    def build(self, rowNumber: int, values: list) -> RowRecord | None:
+        """
+        Description:
+            - Method to build the record of a row.
+
+        Args:
+            * rowNumber (int):
+                - Number of the row in the worksheet.
+            * values (list):
+                - Values of the row (as returned by GoogleSheets.getRowValues()).
+
+        Returns:
+            * RowRecord | None:
+                - Record of the row. Missing trailing cells are ''.
+                - None if the row is empty.
+        """
+        if not values:
+            return None
+        if len(values) < self.width:
+            values = values + self.padding[len(values) :]
+
+        record: RowRecord = self.recordClass.__new__(self.recordClass)
+        record.rowNumber = rowNumber
+        for setter, value in zip(self.setters, self.accessor(values)):
+            setter(record, value)
+        return record
 
 
 class GoogleSheets:
@@ -33,6 +129,8 @@ class GoogleSheets:
         sheetTitleOrIndex: str | int = 0,
         googlCredentialsJSONPath: str = "google-secrets.json",
         exitOnError: bool = True,
+        spreadsheetBackend: SpreadsheetBackend | None = None,
+        headersWithIndex: dict[str, int] | None = None,
     ) -> None:
         """
         Description:
@@ -58,6 +156,13 @@ class GoogleSheets:
                 - Whether to exit the program if an error occurs.
                 - Defaults to True.
                 - If set to False then further you will get abnormal termination of the program.
+            * spreadsheetBackend (SpreadsheetBackend | None, optional):
+                - Spreadsheet to use instead of connecting to Google Sheets (E.g: sheets_backend.FakeSpreadsheet).
+                - If provided then credentials and openSpreadsheetBy are not used.
+                - Defaults to None (Google Sheets using gspread).
+            * headersWithIndex (dict[str, int] | None, optional):
+                - Header name -> index (starts from 0) of the column. Required to fetch rows as records (getRowRecord()).
+                - Defaults to None.
 
         * Returns:
             - None
@@ -65,6 +170,16 @@ class GoogleSheets:
         * Exit:
             * Exit: If there is an error while connecting to Google Sheets or fetching the spreadsheet or worksheet.
         """
+        self.rowRecordFactory: RowRecordFactory | None = (
+            RowRecordFactory(headersWithIndex) if headersWithIndex else None
+        )
+
+        if spreadsheetBackend is not None:
+            self.client = None
+            self.spreadsheet = spreadsheetBackend
+            self.openWorksheet(sheetTitleOrIndex, exitOnError)
+            return
+
         try:
             self.client = gspread.service_account(filename=googlCredentialsJSONPath)
         except Exception as e:
@@ -100,7 +215,24 @@ class GoogleSheets:
                 pressAnyKeyToContinue()
                 exit(-1)
 
-        # Opening the desired worksheet
+        self.openWorksheet(sheetTitleOrIndex, exitOnError)
+
+    def openWorksheet(self, sheetTitleOrIndex: str | int, exitOnError: bool = True) -> None:
+        """
+        Description:
+            - Method to open the desired worksheet of the spreadsheet.
+
+        Args:
+            * sheetTitleOrIndex (str | int):
+                - The title or index of the worksheet to open.
+                - Integer or numeric string will treated as index and string will treated as title.
+            * exitOnError (bool, optional):
+                - Whether to exit the program if an error occurs.
+                - Defaults to True.
+
+        Returns:
+            * None
+        """
         try:
             if isinstance(sheetTitleOrIndex, int) or sheetTitleOrIndex.isnumeric():
                 self.worksheet = self.spreadsheet.get_worksheet(sheetTitleOrIndex)
@@ -175,6 +307,113 @@ class GoogleSheets:
         """
         return self.worksheet.row_values(rowIndex)
 
+    def getMultipleRowValues(self, startRowIndex: int, endRowIndex: int) -> list[list]:
+        """
+        Description:
+            - Method to retrieves the values of multiple consecutive rows in the worksheet at once (single request).
+
+        Args:
+            * startRowIndex (int):
+                - The index of the first row to retrieve values from.
+            * endRowIndex (int):
+                - The index of the last row to retrieve values from (inclusive).
+
+        Returns:
+            * list[list]:
+                - A list containing the list of values of each row (same as getRowValues() for each row).
+                - Empty list([]) for each row that does not exist.
+        """
+        rows: list[list] = self.worksheet.batch_get([f"{startRowIndex}:{endRowIndex}"])[0]
+        # Trailing empty rows are not returned by the API
+        return [list(row) for row in rows] + [[] for _ in range(endRowIndex - startRowIndex + 1 - len(rows))]
+
+    def getRowRecordFactory(self) -> RowRecordFactory:
+        """
+        Description:
+            - Method to get the factory used to build the row records.
+
+        Returns:
+            * RowRecordFactory:
+                - Factory created from the headersWithIndex passed at initialization.
+
+        Raises:
+            * ValueError:
+                - If GoogleSheets is not initialized with headersWithIndex.
+        """
+        if self.rowRecordFactory is None:
+            raise ValueError(
+                "GoogleSheets must be initialized with headersWithIndex to fetch rows as records."
+            )
+        return self.rowRecordFactory
+
+    def getRowRecord(self, rowNumber: int) -> RowRecord | None:
+        """
+        Description:
+            - Method to retrieves a specific row of the worksheet as record.
+            - GoogleSheets must be initialized with headersWithIndex.
+
+        Args:
+            * rowNumber (int):
+                - The number (index) of the row to retrieve.
+
+        Returns:
+            * RowRecord | None:
+                - Record of the row (values as attributes named as headers). Missing trailing cells are ''.
+                - None if the row is empty or does not exist.
+
+        Raises:
+            * ValueError:
+                - If GoogleSheets is not initialized with headersWithIndex.
+        """
+        return self.getRowRecordFactory().build(rowNumber, self.getRowValues(rowNumber))
+
+    def getRowRecords(self, startRowNumber: int, endRowNumber: int) -> list[RowRecord | None]:
+        """
+        Description:
+            - Method to retrieves multiple consecutive rows of the worksheet as records at once (single request).
+            - GoogleSheets must be initialized with headersWithIndex.
+
+        Args:
+            * startRowNumber (int):
+                - The number of the first row to retrieve.
+            * endRowNumber (int):
+                - The number of the last row to retrieve (inclusive).
+
+        Returns:
+            * list[RowRecord | None]:
+                - Record of each row (same as getRowRecord() for each row). None for empty rows.
+
+        Raises:
+            * ValueError:
+                - If GoogleSheets is not initialized with headersWithIndex.
+        """
+        build: Callable[[int, list], RowRecord | None] = self.getRowRecordFactory().build
+        return [
+            build(rowNumber, values)
+            for rowNumber, values in enumerate(
+                self.getMultipleRowValues(startRowNumber, endRowNumber), start=startRowNumber
+            )
+        ]
+
+    def getLastFilledRowNumber(self, columnIndex: int = 1) -> int:
+        """
+        Description:
+            - Method to get the row number of the last filled cell of a column in the worksheet.
+            - Useful to know how many rows are remaining to be processed.
+
+        Args:
+            * columnIndex (int, optional):
+                - The index of the column to check (starts from 1).
+                - Column must be filled for every row of data (like serial number).
+                - Defaults to 1 (column A).
+
+        Returns:
+            * int:
+                - The row number of the last filled cell of the column.
+                - Return 0 if the column is empty.
+        """
+        return len(self.worksheet.col_values(columnIndex))
+
     def getCellValue(self, cell: str) -> str | None:
         """
         Description:
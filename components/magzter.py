@@ -3,7 +3,7 @@
     @author: Suraj Kumar Giri (https://github.com/surajgirioffl)
     @init-date: 24th Nov 2023
     @completed-on: N/A
-    @last-modified: 22nd Jan 2024
+    @last-modified: 19th Oct 2026
     @error-series: 2400
     @description:
         * Module to perform any operations related to magzter for the project.
@@ -48,7 +48,7 @@ class Magzter:
             - Destructor method for the class.
         """
 
-    def login(self, url: str, email: str) -> None:
+    def login(self, url: str, email: str, maxWaitTime: float = 10) -> None:
         """
         Description:
             * Method to logs in to Magzter website using the provided URL and email.
@@ -58,6 +58,9 @@ class Magzter:
                 - The URL of the login page to log in to.
             * email (str):
                 - The email address to use for logging in.
+            * maxWaitTime (float, optional):
+                - The maximum time in seconds to wait for each element of the page.
+                - Defaults to 10.
 
         Returns:
             * None
@@ -67,18 +70,20 @@ class Magzter:
 
         # 'Claim Now' button
         # self.driver.find_element(By.TAG_NAME, "button").click()
-        button: WebElement = scrap_tools.waitUntilElementLoadedInDOM(self.driver, (By.TAG_NAME, "button"))
+        button: WebElement = scrap_tools.waitUntilElementLoadedInDOM(
+            self.driver, (By.TAG_NAME, "button"), maxWaitTime
+        )
         button.click()
 
         # DOM is same and elements are present but focus page content changed. So, no need to use wait-until-load concept because already loaded.
         # Email input
         emailInputElement: WebElement = scrap_tools.waitUntilElementBecomeVisible(
-            self.driver, (By.NAME, "word")
+            self.driver, (By.NAME, "word"), maxWaitTime
         )
         emailInputElement.send_keys(email)
-        self.driver.find_element(By.CLASS_NAME, "login__loginBtnnp").click()
+        scrap_tools.findElement(self.driver, (By.CLASS_NAME, "login__loginBtnnp")).click()
 
-    def writeOTP(self, otp: str) -> None:
+    def writeOTP(self, otp: str, maxWaitTime: float = 10) -> None:
         """
         Description:
             - Method to write OTP (One-Time Password) received from Magzter login.
@@ -87,6 +92,9 @@ class Magzter:
         Args:
             * otp (str):
                 - The OTP (One-Time Password) received from Magzter login.
+            * maxWaitTime (float, optional):
+                - The maximum time in seconds to wait for the OTP input boxes.
+                - Defaults to 10.
 
         Returns:
             * None
@@ -95,16 +103,17 @@ class Magzter:
         # self.driver.find_element(By.ID, "otp1")
 
         # first cell of OTP (digit 1)
-        scrap_tools.waitUntilElementLoadedInDOM(self.driver, (By.ID, "otp1")).send_keys(otp[0])
+        scrap_tools.waitUntilElementLoadedInDOM(self.driver, (By.ID, "otp1"), maxWaitTime).send_keys(otp[0])
+        # OTP input boxes are cached. So, no need to find them again when OTP is rewritten.
         # 2nd cell of OTP (digit 2)
-        self.driver.find_element(By.ID, "otp2").send_keys(otp[1])
+        scrap_tools.findElement(self.driver, (By.ID, "otp2")).send_keys(otp[1])
         # 3rd cell of OTP (digit 3)
-        self.driver.find_element(By.ID, "otp3").send_keys(otp[2])
+        scrap_tools.findElement(self.driver, (By.ID, "otp3")).send_keys(otp[2])
         # 4th cell of OTP (digit 4)
-        self.driver.find_element(By.ID, "otp4").send_keys(otp[3])
+        scrap_tools.findElement(self.driver, (By.ID, "otp4")).send_keys(otp[3])
 
         # clicking on verify button
-        self.driver.find_element(By.CLASS_NAME, "magzter__buttonText").click()
+        scrap_tools.findElement(self.driver, (By.CLASS_NAME, "magzter__buttonText")).click()
 
     def resendOTP(self) -> bool:
         """
@@ -186,11 +195,12 @@ class Magzter:
             return True
 
         try:
-            errorPara: WebElement = self.driver.find_element(By.CLASS_NAME, "magazinename")
+            # Error para is cached. If it is re-rendered (stale) then it is re-found while reading the text.
+            errorPara: WebElement = scrap_tools.findElement(self.driver, (By.CLASS_NAME, "magazinename"))
+            errorText: str = errorPara.text
         except NoSuchElementException as e:
             return False
         else:
-            errorText: str = errorPara.text
             print(f"OTP submission error: {errorText}. Error Code: 2402")
             if errorText.strip() == "Authentication failure":
                 # Returns None if OTP is not successfully submitted due to invalid (wrong) OTP.
@@ -3,7 +3,7 @@
     @author: Suraj Kumar Giri (https://github.com/surajgirioffl)
     @init-date: 24th Nov 2023
     @completed-on: N/A
-    @last-modified: 21st Jan 2024
+    @last-modified: 19th Oct 2026
     @error-series: 2300
     @description:
         * Module to perform any operations related to Microsoft for the project.
@@ -44,7 +44,7 @@ class Microsoft:
             - Destructor method for the class.
         """
 
-    def login(self, url: str, email: str, password: str) -> None:
+    def login(self, url: str, email: str, password: str, maxWaitTime: float = 10) -> None:
         """
         Description:
             * Method to logs in to Microsoft website using the provided URL, email, and password.
@@ -56,6 +56,9 @@ class Microsoft:
                 - The email address to use for logging in.
             * password (str):
                 - The password to use for logging in.
+            * maxWaitTime (float, optional):
+                - The maximum time in seconds to wait for each element of the page.
+                - Defaults to 10.
 
         Returns:
             * None
@@ -65,20 +68,23 @@ class Microsoft:
 
         # Input of email
         # self.driver.find_element(By.ID, "i0116").send_keys(email)
-        emailInputElement: WebElement = scrap_tools.waitUntilElementLoadedInDOM(self.driver, (By.ID, "i0116"))
+        emailInputElement: WebElement = scrap_tools.waitUntilElementLoadedInDOM(
+            self.driver, (By.ID, "i0116"), maxWaitTime
+        )
         emailInputElement.send_keys(email)
-        self.driver.find_element(By.ID, "idSIButton9").click()  # Clicking on next
+        scrap_tools.findElement(self.driver, (By.ID, "idSIButton9")).click()  # Clicking on next
 
         # DOM is same and elements are present but focus page content changed. So, no need to use wait-until-load concept because already loaded.
         # Input of password
         # self.driver.find_element(By.ID, "i0118").send_keys(password)
         passwordInputElement: WebElement = scrap_tools.waitUntilElementBecomeVisible(
-            self.driver, (By.ID, "i0118")
+            self.driver, (By.ID, "i0118"), maxWaitTime
         )
         passwordInputElement.send_keys(password)
-        self.driver.find_element(By.ID, "idSIButton9").click()  # clicking on next
+        # Same button as email page (cached). So, no need to find it again.
+        scrap_tools.findElement(self.driver, (By.ID, "idSIButton9")).click()  # clicking on next
 
-    def openOutlook(self, url: str = "https://outlook.live.com/mail/0/") -> None:
+    def openOutlook(self, url: str = "https://outlook.live.com/mail/0/", maxWaitTime: float = 10) -> None:
         """
         Description:
             - Method to open the Outlook(mail) page in the webdriver instance.
@@ -88,6 +94,9 @@ class Microsoft:
             * url (str):
                 - The URL of the Outlook page to open.
                 - Defaults to "https://outlook.live.com/mail/0/".
+            * maxWaitTime (float, optional):
+                - The maximum time in seconds to wait for each element of the page.
+                - Defaults to 10.
 
         Returns:
             * None
@@ -100,13 +109,13 @@ class Microsoft:
         # It opens a new tab for outlook because of target = _blank. We have update it using Javascript.
         # self.driver.find_element(By.CSS_SELECTOR, 'a[data-bi-cn="SignIn"]')
         signInButton: WebElement = scrap_tools.waitUntilElementLoadedInDOM(
-            self.driver, (By.CSS_SELECTOR, 'a[data-bi-cn="SignIn"]')
+            self.driver, (By.CSS_SELECTOR, 'a[data-bi-cn="SignIn"]'), maxWaitTime
         )
         # Changing target attribute value to '' using javascript. So, that outlook will open in same tab.
         self.driver.execute_script("""document.querySelector('a[data-bi-cn="SignIn"]').target='';""")
         signInButton.click()
 
-    def fetchOTP(self) -> str:
+    def fetchOTP(self, maxWaitTime: float = 10) -> str:
         """
         Description:
             - Method to fetches the OTP (One-Time Password) received from Magzter login from the email list.
@@ -118,6 +127,11 @@ class Microsoft:
             - This method will try to scrap and fetch the OTP from the email list.
             - But it doesn't provide surety to fetch the OTP.
 
+        Args:
+            * maxWaitTime (float, optional):
+                - The maximum time in seconds to wait for the mail list.
+                - Defaults to 10.
+
         Returns:
             * str:
                 - The OTP extracted from the email list.
@@ -125,7 +139,9 @@ class Microsoft:
 
         """
         # mailsContainer = self.driver.find_element(By.ID, "MailList")
-        mailsContainer: WebElement = scrap_tools.waitUntilElementLoadedInDOM(self.driver, (By.ID, "MailList"))
+        mailsContainer: WebElement = scrap_tools.waitUntilElementLoadedInDOM(
+            self.driver, (By.ID, "MailList"), maxWaitTime
+        )
         mailsListInString: str = mailsContainer.text  # similar as JS, <element>.innerText
         mailsList: list[str] = mailsListInString.split("\n")
         mailWithOTP: str = ""
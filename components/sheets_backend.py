@@ -0,0 +1,418 @@
+"""
+    @file: components/sheets_backend.py
+    @author: Suraj Kumar Giri (https://github.com/surajgirioffl)
+    @init-date: 19th Oct 2026
+    @completed-on: N/A
+    @last-modified: 19th Oct 2026
+    @error-series: 2600
+    @description:
+        * Module containing the backend interface used by GoogleSheets (same surface as gspread Spreadsheet/Worksheet).
+        * Also contains an in-memory fake backend to test and benchmark the Sheets I/O offline.
+            - Configurable latency, read/write quota (requests per minute) and injected 429 (rate limit) errors.
+            - Uses a clock which can be virtual. So, latency and quota windows can be simulated without real waiting.
+"""
+
+__author__ = "Suraj Kumar Giri"
+__email__ = "surajgirioffl@gmail.com"
+
+import re
+import csv
+import io
+import json
+from time import monotonic, sleep
+from random import Random
+from collections import deque
+from typing import Any, Literal, Protocol
+from gspread.exceptions import APIError, WorksheetNotFound
+
+
+class WorksheetBackend(Protocol):
+    """
+    Description:
+        - Interface of a worksheet required by GoogleSheets (subset of gspread.Worksheet).
+    """
+
+    def row_values(self, row: int) -> list:
+        ...
+
+    def col_values(self, col: int) -> list:
+        ...
+
+    def batch_get(self, ranges: list[str]) -> list[list[list]]:
+        ...
+
+    def acell(self, label: str) -> Any:
+        ...
+
+    def update_acell(self, label: str, value: Any) -> Any:
+        ...
+
+    def batch_update(self, data: list[dict]) -> Any:
+        ...
+
+
+class SpreadsheetBackend(Protocol):
+    """
+    Description:
+        - Interface of a spreadsheet required by GoogleSheets (subset of gspread.Spreadsheet).
+    """
+
+    def worksheet(self, title: str) -> WorksheetBackend:
+        ...
+
+    def get_worksheet(self, index: int) -> WorksheetBackend:
+        ...
+
+    def export(self, format: str) -> bytes:
+        ...
+
+
+class VirtualClock:
+    """
+    Description:
+        - Clock whose time only advances on sleep().
+        - Used with the fake backend to simulate latency, quota windows and backoff instantly and repeatably.
+    """
+
+    def __init__(self, startTime: float = 0.0) -> None:
+        self.currentTime = startTime
+
+    def time(self) -> float:
+        return self.currentTime
+
+    def sleep(self, seconds: float) -> None:
+        self.currentTime += max(seconds, 0)
+
+
+class RealClock:
+    """
+    Description:
+        - Clock using the real (monotonic) time.
+    """
+
+    @staticmethod
+    def time() -> float:
+        return monotonic()
+
+    @staticmethod
+    def sleep(seconds: float) -> None:
+        sleep(max(seconds, 0))
+
+
+class FakeAPIResponse:
+    """
+    Description:
+        - Minimal response object (like requests.Response) to raise gspread.exceptions.APIError from the fake backend.
+    """
+
+    def __init__(self, statusCode: int, message: str, status: str) -> None:
+        self.status_code = statusCode
+        self.error: dict = {"code": statusCode, "message": message, "status": status}
+        self.text = json.dumps({"error": self.error})
+
+    def json(self) -> dict:
+        return {"error": self.error}
+
+
+class FakeCell:
+    """
+    Description:
+        - Cell returned by FakeWorksheet.acell() (like gspread.Cell).
+    """
+
+    def __init__(self, row: int, col: int, value: str | None) -> None:
+        self.row = row
+        self.col = col
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"<FakeCell R{self.row}C{self.col} {self.value!r}>"
+
+
+def columnLettersToNumber(letters: str) -> int:
+    """
+    Description:
+        - Function to convert column letters to column number. E.g: "A" -> 1, "Z" -> 26, "AA" -> 27
+    """
+    number: int = 0
+    for letter in letters.upper():
+        number = number * 26 + (ord(letter) - ord("A") + 1)
+    return number
+
+
+A1_PATTERN = re.compile(r"^(?:'?[^!]*'?!)?([A-Za-z]*)(\d*)(?::([A-Za-z]*)(\d*))?$")
+
+
+def parseA1Range(label: str) -> tuple[int | None, int | None, int | None, int | None]:
+    """
+    Description:
+        - Function to parse a range in A1 notation. Sheet name (if any) is ignored.
+        - E.g: "B2" -> (2, 2, 2, 2), "A2:C5" -> (2, 1, 5, 3), "2:10" -> (2, None, 10, None), "A:C" -> (None, 1, None, 3)
+
+    Returns:
+        * tuple[int | None, int | None, int | None, int | None]:
+            - (startRow, startColumn, endRow, endColumn) starting from 1. None means unbounded.
+
+    Raises:
+        * ValueError:
+            - If the label is not a valid A1 notation.
+    """
+    match = A1_PATTERN.match(label.strip())
+    if not match or not any(match.groups()):
+        raise ValueError(f"Invalid A1 notation: {label}")
+    startColumn, startRow, endColumn, endRow = match.groups()
+    if endColumn is None and endRow is None:
+        # Single cell
+        endColumn, endRow = startColumn, startRow
+    return (
+        int(startRow) if startRow else None,
+        columnLettersToNumber(startColumn) if startColumn else None,
+        int(endRow) if endRow else None,
+        columnLettersToNumber(endColumn) if endColumn else None,
+    )
+
+
+class FakeSpreadsheet:
+    """
+    Description:
+        - In-memory fake of gspread.Spreadsheet (implements SpreadsheetBackend).
+        - Every call of the fake worksheets (and export) is counted as one request of the Sheets API.
+            - Each request waits for the configured latency (on the clock).
+            - Each request is checked against the read/write quota (requests per minute). Exceeding it raises APIError (429).
+            - Random 429 errors can be injected with a probability or forced for the next N requests.
+
+    Usage:
+        spreadsheet = FakeSpreadsheet("testing", {"Sheet1": [["sno", "email"], ["1", "a@b.com"]]}, latency=0.2)
+        gs = GoogleSheets("testing", sheetTitleOrIndex="Sheet1", spreadsheetBackend=spreadsheet)
+    """
+
+    def __init__(
+        self,
+        title: str = "testing",
+        worksheets: dict[str, list[list[str]]] | None = None,
+        latency: float = 0.0,
+        readRequestsPerMinute: int | None = None,
+        writeRequestsPerMinute: int | None = None,
+        errorRate: float = 0.0,
+        seed: int | None = None,
+        clock: VirtualClock | RealClock | None = None,
+    ) -> None:
+        """
+        Description:
+            - Initializes a new instance of the class.
+
+        Args:
+            * title (str, optional):
+                - Title of the spreadsheet.
+                - Defaults to "testing".
+            * worksheets (dict[str, list[list[str]]] | None, optional):
+                - Worksheet title -> rows (list of values of each row, starting from row 1).
+                - Defaults to None (a single empty worksheet "Sheet1").
+            * latency (float, optional):
+                - Latency of each request in seconds.
+                - Defaults to 0.0.
+            * readRequestsPerMinute (int | None, optional):
+                - Quota of read requests per minute. None means no quota.
+                - Defaults to None. (Google Sheets API allows 60 per minute per user)
+            * writeRequestsPerMinute (int | None, optional):
+                - Quota of write requests per minute. None means no quota.
+                - Defaults to None. (Google Sheets API allows 60 per minute per user)
+            * errorRate (float, optional):
+                - Probability (0 to 1) of an injected 429 error on each request.
+                - Defaults to 0.0.
+            * seed (int | None, optional):
+                - Seed of the random generator of injected errors (for repeatable runs).
+                - Defaults to None.
+            * clock (VirtualClock | RealClock | None, optional):
+                - Clock used for latency and quota windows.
+                - Defaults to None (RealClock).
+
+        Returns:
+            * None
+        """
+        self.title = title
+        self.latency = latency
+        self.quota: dict[str, int | None] = {"read": readRequestsPerMinute, "write": writeRequestsPerMinute}
+        self.errorRate = errorRate
+        self.random = Random(seed)
+        self.clock = clock or RealClock()
+
+        self.forcedErrors: int = 0
+        self.requestTimes: dict[str, deque[float]] = {"read": deque(), "write": deque()}
+        self.requestCounts: dict[str, int] = {"read": 0, "write": 0, "throttled": 0}
+
+        self.worksheets: list[FakeWorksheet] = [
+            FakeWorksheet(self, worksheetTitle, rows)
+            for worksheetTitle, rows in (worksheets or {"Sheet1": []}).items()
+        ]
+
+    def injectErrors(self, count: int) -> None:
+        """
+        Description:
+            - Method to force 429 error on the next 'count' requests.
+        """
+        self.forcedErrors += count
+
+    def resetRequestCounts(self) -> None:
+        """
+        Description:
+            - Method to reset the request counters (requestCounts).
+        """
+        self.requestCounts = {"read": 0, "write": 0, "throttled": 0}
+
+    def request(self, kind: Literal["read", "write"]) -> None:
+        """
+        Description:
+            - Method to simulate a request of the Sheets API (called by each operation of the fake).
+
+        Raises:
+            * gspread.exceptions.APIError:
+                - With status code 429 if quota is exceeded or an error is injected.
+        """
+        self.clock.sleep(self.latency)
+        now: float = self.clock.time()
+
+        # Removing requests older than a minute from the quota window
+        requestTimes: deque[float] = self.requestTimes[kind]
+        while requestTimes and now - requestTimes[0] >= 60:
+            requestTimes.popleft()
+
+        quota: int | None = self.quota[kind]
+        if quota is not None and len(requestTimes) >= quota:
+            self.throttle(f"Quota exceeded for quota metric '{kind.title()} requests per minute per user'.")
+        if self.forcedErrors > 0:
+            self.forcedErrors -= 1
+            self.throttle("Injected rate limit error.")
+        if self.errorRate and self.random.random() < self.errorRate:
+            self.throttle("Injected rate limit error.")
+
+        requestTimes.append(now)
+        self.requestCounts[kind] += 1
+
+    def throttle(self, message: str) -> None:
+        self.requestCounts["throttled"] += 1
+        raise APIError(FakeAPIResponse(429, message, "RESOURCE_EXHAUSTED"))
+
+    def worksheet(self, title: str) -> "FakeWorksheet":
+        for worksheet in self.worksheets:
+            if worksheet.title == title:
+                return worksheet
+        raise WorksheetNotFound(title)
+
+    def get_worksheet(self, index: int | str) -> "FakeWorksheet":
+        try:
+            return self.worksheets[int(index)]
+        except IndexError:
+            raise WorksheetNotFound(index)
+
+    def export(self, format: str = "text/csv") -> bytes:
+        """
+        Description:
+            - Method to export the spreadsheet.
+            - Always exports the first worksheet as CSV (whatever the format is), enough to simulate the transfer.
+        """
+        self.request("read")
+        output = io.StringIO()
+        csv.writer(output).writerows(self.worksheets[0].rows if self.worksheets else [])
+        return output.getvalue().encode("utf-8")
+
+
+class FakeWorksheet:
+    """
+    Description:
+        - In-memory fake of gspread.Worksheet (implements WorksheetBackend).
+        - Returns values like gspread: trailing empty cells of a row (and trailing empty rows of a range) are omitted.
+    """
+
+    def __init__(self, spreadsheet: FakeSpreadsheet, title: str, rows: list[list[str]]) -> None:
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.rows: list[list[str]] = [[str(value) for value in row] for row in rows]
+
+    @staticmethod
+    def trim(values: list[str]) -> list[str]:
+        # Removing trailing empty values (like Google Sheets API)
+        end: int = len(values)
+        while end and values[end - 1] == "":
+            end -= 1
+        return values[:end]
+
+    def getValue(self, row: int, col: int) -> str:
+        if row <= len(self.rows) and col <= len(self.rows[row - 1]):
+            return self.rows[row - 1][col - 1]
+        return ""
+
+    def setValue(self, row: int, col: int, value: Any) -> None:
+        while len(self.rows) < row:
+            self.rows.append([])
+        values: list[str] = self.rows[row - 1]
+        while len(values) < col:
+            values.append("")
+        values[col - 1] = "" if value is None else str(value)
+
+    def getRange(self, label: str) -> list[list[str]]:
+        startRow, startColumn, endRow, endColumn = parseA1Range(label)
+        startRow, startColumn = startRow or 1, startColumn or 1
+        endRow = endRow or len(self.rows)
+        endColumn = endColumn or max((len(row) for row in self.rows), default=0)
+        values: list[list[str]] = [
+            self.trim([self.getValue(row, col) for col in range(startColumn, endColumn + 1)])
+            for row in range(startRow, min(endRow, len(self.rows)) + 1)
+        ]
+        while values and not values[-1]:
+            values.pop()
+        return values
+
+    def row_values(self, row: int) -> list[str]:
+        self.spreadsheet.request("read")
+        return self.trim(list(self.rows[row - 1])) if row <= len(self.rows) else []
+
+    def col_values(self, col: int) -> list[str]:
+        self.spreadsheet.request("read")
+        return self.trim([self.getValue(row, col) for row in range(1, len(self.rows) + 1)])
+
+    def batch_get(self, ranges: list[str]) -> list[list[list[str]]]:
+        self.spreadsheet.request("read")
+        return [self.getRange(label) for label in ranges]
+
+    def acell(self, label: str) -> FakeCell:
+        self.spreadsheet.request("read")
+        row, col, _, _ = parseA1Range(label)
+        value: str = self.getValue(row, col)
+        return FakeCell(row, col, value if value != "" else None)
+
+    def update_acell(self, label: str, value: Any) -> dict:
+        self.spreadsheet.request("write")
+        row, col, _, _ = parseA1Range(label)
+        self.setValue(row, col, value)
+        return {"updatedCells": 1}
+
+    def batch_update(self, data: list[dict]) -> dict:
+        self.spreadsheet.request("write")
+        updatedCells: int = 0
+        for item in data:
+            startRow, startColumn, _, _ = parseA1Range(item["range"])
+            for rowOffset, values in enumerate(item["values"]):
+                for columnOffset, value in enumerate(values):
+                    self.setValue(startRow + rowOffset, startColumn + columnOffset, value)
+                    updatedCells += 1
+        return {"totalUpdatedCells": updatedCells}
+
+
+if __name__ == "__main__":
+    clock = VirtualClock()
+    spreadsheet = FakeSpreadsheet(
+        worksheets={"Sheet1": [["sno", "email"], ["1", "a@b.com"], ["2", ""]]},
+        latency=0.2,
+        readRequestsPerMinute=2,
+        clock=clock,
+    )
+    worksheet = spreadsheet.get_worksheet(0)
+    print(worksheet.row_values(2), worksheet.batch_get(["A1:B3"]))
+    try:
+        worksheet.acell("B3")
+    except APIError as e:
+        print("Throttled:", e)
+    worksheet.batch_update([{"range": "B3", "values": [["c@d.com"]]}])
+    clock.sleep(60)  # Waiting for the quota window (instantly, virtual clock)
+    print(spreadsheet.export(), spreadsheet.requestCounts, clock.time())
@@ -3,7 +3,7 @@
     @author: Suraj Kumar Giri (https://github.com/surajgirioffl)
     @init-date: 22nd Jan 2024
     @completed-on: N/A
-    @last-modified: 23rd Jan 2024
+    @last-modified: 19th Oct 2026
     @error-series: 2500
     @description:
         * Module to perform any operations related to Stripe for the project.
@@ -46,7 +46,9 @@ class Stripe:
             - Destructor method for the class.
         """
 
-    def writeCardInformation(self, cardNumber: str, cardExpiry: str, cvc: str, cardholderName: str) -> None:
+    def writeCardInformation(
+        self, cardNumber: str, cardExpiry: str, cvc: str, cardholderName: str, maxWaitTime: float = 10
+    ) -> None:
         """
         Description:
             - Method to writes the card information to the corresponding input boxes on the checkout page of Magzter and proceed.
@@ -61,13 +63,18 @@ class Stripe:
                 - The cvc number to be entered.
             * cardholderName (str):
                 - The name of the cardholder to be entered.
+            * maxWaitTime (float, optional):
+                - The maximum time in seconds to wait for the card number input box.
+                - Defaults to 10.
 
         Returns:
             * None
         """
         # card number input box: id = 'cardNumber'
         # self.driver.find_element(By.ID, "cardNumber").send_keys(cardNumber)
-        scrap_tools.waitUntilElementLoadedInDOM(self.driver, (By.ID, "cardNumber")).send_keys(cardNumber)
+        scrap_tools.waitUntilElementLoadedInDOM(self.driver, (By.ID, "cardNumber"), maxWaitTime).send_keys(
+            cardNumber
+        )
 
         # card expiry input box: id = 'cardExpiry'
         self.driver.find_element(By.ID, "cardExpiry").send_keys(cardExpiry)
@@ -129,7 +136,7 @@ class Stripe:
         sleep(sleepTimeOnEachEntry)
         press("enter")
 
-    def isCorrectEmailOnPaymentPage(self, correctEmail: str) -> bool:
+    def isCorrectEmailOnPaymentPage(self, correctEmail: str, maxWaitTime: float = 10) -> bool:
         """
         Description:
             - This function checks if the email entered on the payment page matches the correct email.
@@ -137,13 +144,16 @@ class Stripe:
         Args:
             * correctEmail (str):
                 - The correct email that should be on the payment page.
+            * maxWaitTime (float, optional):
+                - The maximum time in seconds to wait for the email on the payment page.
+                - Defaults to 10.
 
         Returns:
             * bool: True if the email on the payment page matches the correct email, False otherwise.
         """
         # "document.querySelector('.ReadOnlyFormField-title').innerText" give the readonly email from which the payment link belongs to.
         emailOnPaymentPage: str = scrap_tools.waitUntilElementLoadedInDOM(
-            self.driver, (By.CSS_SELECTOR, ".ReadOnlyFormField-title")
+            self.driver, (By.CSS_SELECTOR, ".ReadOnlyFormField-title"), maxWaitTime
         ).text.strip()
         return emailOnPaymentPage == correctEmail
 
@@ -266,7 +276,7 @@ class Stripe:
                 if totalWaitTime >= maxWaitTime:
                     return False
 
-        if waitUntilDesiredNumberOfIframes():
+        if waitUntilDesiredNumberOfIframes(maxWaitTime=maxWaitTimeForFormLoad):
             sleep(2)
             press("tab")
             write(corporateId)
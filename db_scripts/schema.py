@@ -3,18 +3,49 @@
     @author: Suraj Kumar Giri (https://github.com/surajgirioffl)
     @init-date: 29th Nov 2023
     @completed-on: N/A
-    @last-modified: 29th Nov 2023
+    @last-modified: 19th Oct 2026
     @error-series: 4100
     @description:
             - Module containing schema for tables of databases(classname).
+            - Migrations of a table are list of migrations where each migration is a list of SQL statements.
+                - migrations[0] creates the version 1, migrations[1] creates the version 2 and so on.
+                - Never modify an existing migration, always append a new one.
 """
 __author__ = "Suraj Kumar Giri"
 __email__ = "surajgirioffl@gmail.com"
 
 
+class SchemaVersion:
+    SELECT_VERSION: str = """-- sql
+                        SELECT `version` FROM `schema_version`
+                        WHERE `name` = ?
+                    """
+
+    UPSERT_VERSION: str = """-- sql
+                        INSERT INTO `schema_version` (`name`, `version`)
+                        VALUES (?, ?)
+                        ON CONFLICT(`name`) DO UPDATE SET
+                            `version` = excluded.`version`,
+                            `migrated_at` = DATETIME('now', 'localtime')
+                    """
+
+    @staticmethod
+    def getSchemaVersionTableSchema() -> str:
+        schema: str = """-- sql
+                        CREATE TABLE IF NOT EXISTS `schema_version`
+                        (
+                            `name` VARCHAR(255) PRIMARY KEY NOT NULL,
+                            `version` INTEGER NOT NULL,
+                            `migrated_at` DATETIME NOT NULL DEFAULT (DATETIME('now', 'localtime'))
+                        );
+                    """
+        return schema
+
+
 class Spreadsheet:
     @staticmethod
     def getIPTableSchema(tableName: str) -> str:
+        tableName = tableName.replace("`", "``")
         schema: str = f"""-- sql
                         CREATE TABLE IF NOT EXISTS `{tableName}`
                         (
@@ -23,3 +54,11 @@ class Spreadsheet:
                         );
                     """
         return schema
+
+    @staticmethod
+    def getIPTableMigrations(tableName: str) -> list[list[str]]:
+        migrations: list[list[str]] = [
+            # Version 1: IP table
+            [Spreadsheet.getIPTableSchema(tableName)],
+        ]
+        return migrations
@@ -3,7 +3,7 @@
     @author: Suraj Kumar Giri (https://github.com/surajgirioffl)
     @init-date: 24th Nov 2023
     @completed-on: N/A
-    @last-modified: 29th Nov 2023
+    @last-modified: 19th Oct 2026
     @error-series: 4200
     @description:
         - Module to handle database related operations on spreadsheet.
@@ -11,8 +11,9 @@
 __author__ = "Suraj Kumar Giri"
 __email__ = "surajgirioffl@gmail.com"
 
-import sqlite3 as sqlite
+from contextlib import AbstractContextManager
 from db_scripts import schema
+from db_scripts.sqlite_db import SQLiteDatabase, quoteIdentifier
 
 
 class Spreadsheet:
@@ -25,6 +26,7 @@ class Spreadsheet:
         """
         Description:
             - Constructor to instantiate Spreadsheet object.
+            - Uses the shared connection of the database file. So, multiple instances of the same spreadsheet don't open multiple connections.
 
         Args:
             * databaseName(str):
@@ -39,12 +41,11 @@ class Spreadsheet:
         Returns:
             * None
         """
+        self.tableName = tableName
+        self.databaseName = databaseName
         try:
-            self.conn = sqlite.connect(f"{path}/{databaseName}.db")
-            self.cursor = self.conn.cursor()
+            self.db = SQLiteDatabase(f"{path}/{databaseName}.db")
             self.connectionStatus = True
-            self.tableName = tableName
-            self.databaseName = databaseName
         except Exception as e:
             print("Connection failed. Error code 4201")
             print("Exception:", e)
@@ -52,20 +53,37 @@ class Spreadsheet:
             self.connectionStatus = False
         else:
             try:
-                self.cursor.execute(schema.Spreadsheet.getIPTableSchema(tableName))
-                self.conn.commit()
+                self.db.migrate(tableName, schema.Spreadsheet.getIPTableMigrations(tableName))
             except Exception as e:
                 print(f"Unable to create table {tableName}. Error Code: 4202")
                 print("Exception:", e)
 
-    def __del__(self) -> None:
+        # Queries are built once. So, same SQL text is used on every call and the prepared statement is reused.
+        quotedTableName: str = quoteIdentifier(tableName)
+        self.isIpExistsQuery: str = f"SELECT 1 FROM {quotedTableName} WHERE `ip` = ? LIMIT 1"
+        self.insertIpQuery: str = f"INSERT INTO {quotedTableName} (`ip`) VALUES (?)"
+
+    def close(self) -> None:
         """
         @description:
-            - Destructor to destroy the instance.
+            - Method to close the connection of the database.
+            - Not required to call explicitly, all connections are closed on exit of the application.
         """
         if self.connectionStatus:
-            self.conn.commit()
-            self.conn.close()
+            self.db.close()
+            self.connectionStatus = False
+
+    def transaction(self) -> AbstractContextManager:
+        """
+        Description:
+            - Method to group multiple writes in a single transaction.
+            - E.g: with spreadsheetDb.transaction(): ...
+
+        Returns:
+            * AbstractContextManager:
+                - Context manager which commits on success and rolls back on exception.
+        """
+        return self.db.transaction()
 
     def isIpExists(self, ip: str) -> bool:
         """
@@ -81,20 +99,14 @@ class Spreadsheet:
                 - True if the IP address exists in the table, False otherwise.
         """
         try:
-            self.cursor.execute(
-                f"""-- sql
-                    SELECT * FROM `{self.tableName}`
-                    WHERE ip = '{ip}'
-                """
-            )
+            row: tuple | None = self.db.fetchOne(self.isIpExistsQuery, (ip,))
         except Exception as e:
             print("Something went wrong while checking if IP exists. Error Code: 4203")
             print("Exception: ", e)
         else:
-            return self.cursor.fetchone() is not None
+            return row is not None
 
     def insertIp(self, ip: str) -> None:
-        """"""
         """
         Description:
             - Method to insert an IP address into the database.
@@ -111,18 +123,34 @@ class Spreadsheet:
             * Exception: If there is an error while inserting the IP address.
         """
         try:
-            self.cursor.execute(
-                f"""-- sql
-                    INSERT INTO `{self.tableName}` (ip)
-                    VALUES('{ip}')
-                """
-            )
+            self.db.execute(self.insertIpQuery, (ip,))
         except Exception as e:
             print("Something went wrong while inserting IP. Error Code: 4204")
             print("Exception: ", e)
             raise e.__class__(e)
-        else:
-            self.conn.commit()
+
+    def insertMultipleIps(self, ips: list[str]) -> int:
+        """
+        Description:
+            - Method to insert multiple IP addresses into the database at once (in a single transaction).
+
+        Args:
+            * ips (list[str]):
+                - The IP addresses to insert.
+
+        Returns:
+            * int:
+                - Number of IP addresses inserted.
+
+        Raises:
+            * Exception: If there is an error while inserting the IP addresses. No IP address is inserted in that case.
+        """
+        try:
+            return self.db.executeMany(self.insertIpQuery, [(ip,) for ip in ips])
+        except Exception as e:
+            print("Something went wrong while inserting multiple IPs. Error Code: 4205")
+            print("Exception: ", e)
+            raise e.__class__(e)
 
 
 if __name__ == "__main__":
@@ -130,3 +158,4 @@ if __name__ == "__main__":
     print(spreadsheet.isIpExists("127.9.61.92"))
     print(spreadsheet.isIpExists("128.9.61.93"))
     spreadsheet.insertIp("128.9.61.93")
+    spreadsheet.insertMultipleIps(["128.9.61.94", "128.9.61.95"])
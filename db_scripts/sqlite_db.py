@@ -0,0 +1,309 @@
+"""
+    @file: db_scripts/sqlite_db.py
+    @author: Suraj Kumar Giri (https://github.com/surajgirioffl)
+    @init-date: 19th Oct 2026
+    @completed-on: N/A
+    @last-modified: 19th Oct 2026
+    @error-series: 4300
+    @description:
+        - Module containing reusable layer to handle SQLite databases of the application.
+        - One shared connection per database file (WAL mode, synchronous=NORMAL).
+        - Parameterized statements only (sqlite3 caches the prepared statements by SQL text).
+        - Explicit transactions, bulk operations and schema migrations using a schema version table.
+"""
+__author__ = "Suraj Kumar Giri"
+__email__ = "surajgirioffl@gmail.com"
+
+import atexit
+import sqlite3 as sqlite
+from os.path import abspath
+from threading import RLock
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+from db_scripts import schema
+
+# Shared connections (one per database file). Key is absolute path of the database file.
+_connections: dict[str, sqlite.Connection] = {}
+_connectionsLock = RLock()
+
+# Number of prepared statements cached by each connection.
+CACHED_STATEMENTS: int = 256
+
+
+def quoteIdentifier(identifier: str) -> str:
+    """
+    Description:
+        - Function to quote an identifier (table name, column name etc.) to use it safely inside an SQL query.
+        - Identifiers can't be parameterized. So, they must be quoted.
+
+    Args:
+        * identifier (str):
+            - The identifier to quote.
+
+    Returns:
+        * str:
+            - The quoted identifier. E.g: my`table -> `my``table`
+    """
+    return "`" + identifier.replace("`", "``") + "`"
+
+
+def getSharedConnection(databasePath: str) -> sqlite.Connection:
+    """
+    Description:
+        - Function to get the shared connection of the specified database file.
+        - Connection is created (and configured) only on first call for a database file. Later calls return the same connection.
+
+    Args:
+        * databasePath (str):
+            - Path of the database file.
+
+    Returns:
+        * sqlite3.Connection:
+            - The shared connection of the database file.
+            - Connection is in autocommit mode (isolation_level=None). Use SQLiteDatabase.transaction() to group writes.
+    """
+    key: str = abspath(databasePath)
+    with _connectionsLock:
+        connection: sqlite.Connection | None = _connections.get(key)
+        if connection is None:
+            connection = sqlite.connect(
+                key, isolation_level=None, check_same_thread=False, cached_statements=CACHED_STATEMENTS
+            )
+            # WAL + synchronous=NORMAL: no fsync on every commit, still safe from corruption.
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            _connections[key] = connection
+        return connection
+
+
+def closeSharedConnection(databasePath: str) -> None:
+    """
+    Description:
+        - Function to close the shared connection of the specified database file (if opened).
+
+    Args:
+        * databasePath (str):
+            - Path of the database file.
+
+    Returns:
+        * None
+    """
+    with _connectionsLock:
+        connection: sqlite.Connection | None = _connections.pop(abspath(databasePath), None)
+        if connection is not None:
+            if connection.in_transaction:
+                connection.commit()
+            connection.close()
+
+
+def closeAllSharedConnections() -> None:
+    """
+    Description:
+        - Function to close all shared connections.
+        - Automatically called on exit of the application.
+
+    Returns:
+        * None
+    """
+    with _connectionsLock:
+        for databasePath in list(_connections):
+            closeSharedConnection(databasePath)
+
+
+atexit.register(closeAllSharedConnections)
+
+
+class SQLiteDatabase:
+    """
+    @description:
+        - Class to perform operations on a SQLite database using the shared connection of the database file.
+    """
+
+    def __init__(self, databasePath: str) -> None:
+        """
+        Description:
+            - Constructor to instantiate SQLiteDatabase object.
+
+        Args:
+            * databasePath (str):
+                - Path of the database file.
+
+        Returns:
+            * None
+
+        Raises:
+            * sqlite3.Error:
+                - If connection can't be established.
+        """
+        self.databasePath = databasePath
+        self.conn: sqlite.Connection = getSharedConnection(databasePath)
+        self.conn.execute(schema.SchemaVersion.getSchemaVersionTableSchema())
+
+    def close(self) -> None:
+        """
+        Description:
+            - Method to close the shared connection of the database file.
+            - Other instances using the same database file will also lose the connection. So, call it only on cleanup.
+
+        Returns:
+            * None
+        """
+        closeSharedConnection(self.databasePath)
+
+    def execute(self, query: str, parameters: tuple | dict = ()) -> sqlite.Cursor:
+        """
+        Description:
+            - Method to execute a parameterized query.
+            - Same query string (SQL text) reuses the cached prepared statement. So, never format values into the query.
+
+        Args:
+            * query (str):
+                - The query to execute. Use '?' or ':name' placeholders for values.
+            * parameters (tuple | dict, optional):
+                - Values of the placeholders.
+                - Defaults to ().
+
+        Returns:
+            * sqlite3.Cursor:
+                - Cursor of the executed query.
+        """
+        return self.conn.execute(query, parameters)
+
+    def executeMany(self, query: str, sequenceOfParameters: Iterable[tuple | dict]) -> int:
+        """
+        Description:
+            - Method to execute a parameterized query for each parameters in the sequence (bulk operation).
+            - All executions are done inside a single transaction.
+
+        Args:
+            * query (str):
+                - The query to execute. Use '?' or ':name' placeholders for values.
+            * sequenceOfParameters (Iterable[tuple | dict]):
+                - Values of the placeholders for each execution.
+
+        Returns:
+            * int:
+                - Number of rows modified.
+        """
+        with self.transaction():
+            return self.conn.executemany(query, sequenceOfParameters).rowcount
+
+    def fetchOne(self, query: str, parameters: tuple | dict = ()) -> tuple | None:
+        """
+        Description:
+            - Method to execute a parameterized query and fetch the first row of the result.
+
+        Args:
+            * query (str):
+                - The query to execute.
+            * parameters (tuple | dict, optional):
+                - Values of the placeholders.
+                - Defaults to ().
+
+        Returns:
+            * tuple | None:
+                - First row of the result or None if no rows.
+        """
+        return self.conn.execute(query, parameters).fetchone()
+
+    def fetchAll(self, query: str, parameters: tuple | dict = ()) -> list[tuple]:
+        """
+        Description:
+            - Method to execute a parameterized query and fetch all rows of the result.
+
+        Args:
+            * query (str):
+                - The query to execute.
+            * parameters (tuple | dict, optional):
+                - Values of the placeholders.
+                - Defaults to ().
+
+        Returns:
+            * list[tuple]:
+                - All rows of the result.
+        """
+        return self.conn.execute(query, parameters).fetchall()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite.Connection]:
+        """
+        Description:
+            - Context manager to group multiple writes in a single transaction.
+            - Commits on success and rolls back if any exception occurs.
+            - Nested calls join the outer transaction.
+
+        Usage:
+            with db.transaction():
+                db.execute(...)
+                db.execute(...)
+
+        Yields:
+            * sqlite3.Connection:
+                - The shared connection.
+        """
+        if self.conn.in_transaction:
+            # Already inside a transaction. So, join it.
+            yield self.conn
+            return
+
+        self.conn.execute("BEGIN")
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.rollback()
+            raise
+        else:
+            self.conn.commit()
+
+    def getSchemaVersion(self, name: str) -> int:
+        """
+        Description:
+            - Method to get the current schema version of the specified schema (generally a table).
+
+        Args:
+            * name (str):
+                - Name of the schema.
+
+        Returns:
+            * int:
+                - Current schema version. 0 if schema is not created yet.
+        """
+        row: tuple | None = self.fetchOne(schema.SchemaVersion.SELECT_VERSION, (name,))
+        return row[0] if row else 0
+
+    def migrate(self, name: str, migrations: list[list[str]]) -> int:
+        """
+        Description:
+            - Method to migrate the specified schema to the latest version.
+            - migrations[0] migrates version 0 to 1, migrations[1] migrates version 1 to 2 and so on.
+            - Each migration is applied in its own transaction along with the update of the schema version.
+
+        Args:
+            * name (str):
+                - Name of the schema (generally a table).
+            * migrations (list[list[str]]):
+                - List of migrations. Each migration is a list of SQL statements.
+
+        Returns:
+            * int:
+                - Schema version after migration.
+
+        Raises:
+            * sqlite3.Error:
+                - If any migration fails. Failed migration is rolled back.
+        """
+        currentVersion: int = self.getSchemaVersion(name)
+        for version, statements in enumerate(migrations[currentVersion:], start=currentVersion + 1):
+            with self.transaction():
+                for statement in statements:
+                    self.conn.execute(statement)
+                self.conn.execute(schema.SchemaVersion.UPSERT_VERSION, (name, version))
+            currentVersion = version
+        return currentVersion
+
+
+if __name__ == "__main__":
+    db = SQLiteDatabase("test.db")
+    print(db.migrate("temp", schema.Spreadsheet.getIPTableMigrations("temp")))
+    db.executeMany("INSERT OR IGNORE INTO `temp` (ip) VALUES (?)", [("127.0.0.1",), ("127.0.0.2",)])
+    print(db.fetchAll("SELECT * FROM `temp`"))
@@ -0,0 +1,415 @@
+"""
+    @file: utilities/content_blocking.py
+    @author: Suraj Kumar Giri (https://github.com/surajgirioffl)
+    @init-date: 19th Oct 2026
+    @completed-on: N/A
+    @last-modified: 19th Oct 2026
+    @error-series: 3400
+    @description:
+        * Module to apply a content blocking profile (settings.json -> browser.blocking) to the browser sessions.
+        * Firefox:
+            - Preferences to stop telemetry, prefetching and other background traffic of a fresh profile.
+            - A small temporary extension (generated on the fly) to block the configured URL patterns and resource types.
+        * Chrome:
+            - Command line switches to stop background traffic.
+            - Network.setBlockedURLs (CDP) to block the configured URL patterns (resource types are mapped to URL patterns).
+        * Also provides statistics (requests, bytes, blocked requests) of the current page to log the savings.
+"""
+
+__author__ = "Suraj Kumar Giri"
+__email__ = "surajgirioffl@gmail.com"
+
+import os
+import json
+import zipfile
+import hashlib
+import tempfile
+from selenium.webdriver import Chrome, Edge, Firefox
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+# Preferences of Firefox to stop the background traffic of each fresh profile (telemetry, safe browsing updates, prefetch etc.)
+FIREFOX_BACKGROUND_TRAFFIC_PREFERENCES: dict[str, bool | int | str] = {
+    "toolkit.telemetry.enabled": False,
+    "toolkit.telemetry.unified": False,
+    "toolkit.telemetry.archive.enabled": False,
+    "datareporting.healthreport.uploadEnabled": False,
+    "datareporting.policy.dataSubmissionEnabled": False,
+    "browser.ping-centre.telemetry": False,
+    "browser.newtabpage.activity-stream.feeds.telemetry": False,
+    "browser.newtabpage.activity-stream.telemetry": False,
+    "app.normandy.enabled": False,
+    "app.shield.optoutstudies.enabled": False,
+    "browser.safebrowsing.malware.enabled": False,
+    "browser.safebrowsing.phishing.enabled": False,
+    "browser.safebrowsing.downloads.enabled": False,
+    "browser.safebrowsing.blockedURIs.enabled": False,
+    "extensions.getAddons.cache.enabled": False,
+    "extensions.update.enabled": False,
+    "network.prefetch-next": False,
+    "network.dns.disablePrefetch": True,
+    "network.predictor.enabled": False,
+    "network.http.speculative-parallel-limit": 0,
+    "privacy.trackingprotection.enabled": True,
+}
+
+# Switches of Chrome to stop the background traffic of each fresh profile
+CHROME_BACKGROUND_TRAFFIC_ARGUMENTS: list[str] = [
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-domain-reliability",
+    "--disable-sync",
+    "--no-pings",
+]
+
+# Resource type -> URL patterns (used by Chrome because Network.setBlockedURLs only supports URL patterns)
+RESOURCE_TYPE_URL_PATTERNS: dict[str, list[str]] = {
+    "font": [
+        "*.woff",
+        "*.woff?*",
+        "*.woff2",
+        "*.woff2?*",
+        "*.ttf",
+        "*.ttf?*",
+        "*.otf",
+        "*.otf?*",
+        "*.eot",
+        "*.eot?*",
+    ],
+    "media": ["*.mp4", "*.mp4?*", "*.webm", "*.webm?*", "*.mp3", "*.mp3?*", "*.ogg", "*.ogg?*", "*.m3u8*"],
+    "image": [
+        "*.png",
+        "*.png?*",
+        "*.jpg",
+        "*.jpg?*",
+        "*.jpeg",
+        "*.jpeg?*",
+        "*.gif",
+        "*.gif?*",
+        "*.webp",
+        "*.webp?*",
+    ],
+}
+
+# Resource type -> request types of the WebExtension API (used by Firefox extension)
+RESOURCE_TYPE_REQUEST_TYPES: dict[str, list[str]] = {
+    "font": ["font"],
+    "media": ["media"],
+    "image": ["image", "imageset"],
+}
+
+FIREFOX_EXTENSION_ID: str = "content-blocking@magzter-purchase-automation"
+
+FIREFOX_EXTENSION_BACKGROUND_SCRIPT: str = """
+const PATTERNS = %s.map(function (pattern) {
+    return new RegExp("^" + pattern.split("*").map(function (part) {
+        return part.replace(/[.+?^${}()|[\\]\\\\]/g, "\\\\$&");
+    }).join(".*") + "$");
+});
+const TYPES = %s;
+const blocked = {};  // Tab id -> blocked requests of the current page
+
+browser.webRequest.onBeforeRequest.addListener(function (details) {
+    if (details.type === "main_frame") {
+        // New page. Page itself is never blocked.
+        blocked[details.tabId] = 0;
+        return {};
+    }
+    if (TYPES.includes(details.type) || PATTERNS.some(function (pattern) { return pattern.test(details.url); })) {
+        blocked[details.tabId] = (blocked[details.tabId] || 0) + 1;
+        return {cancel: true};
+    }
+    return {};
+}, {urls: ["<all_urls>"]}, ["blocking"]);
+
+browser.runtime.onMessage.addListener(function (message, sender) {
+    return Promise.resolve(blocked[sender.tab.id] || 0);
+});
+"""
+
+# Content script to answer the query of blocked requests from the page (selenium) using the background script.
+FIREFOX_EXTENSION_CONTENT_SCRIPT: str = """
+window.addEventListener("message", function (event) {
+    if (event.source !== window || !event.data || event.data.type !== "blocked-requests-query") {
+        return;
+    }
+    browser.runtime.sendMessage("blocked-requests").then(function (count) {
+        window.postMessage({type: "blocked-requests", count: count}, "*");
+    });
+});
+"""
+
+# Script to get statistics of the current page (async, last argument is the callback of selenium)
+PAGE_LOAD_STATISTICS_SCRIPT: str = """
+const callback = arguments[arguments.length - 1];
+const entries = performance.getEntriesByType("navigation").concat(performance.getEntriesByType("resource"));
+const statistics = {
+    requests: entries.length,
+    bytes: entries.reduce(function (total, entry) { return total + (entry.transferSize || 0); }, 0),
+    blocked: null
+};
+if (!arguments[0]) {
+    callback(statistics);
+    return;
+}
+// Blocked requests are counted by the extension (Firefox only)
+const timer = setTimeout(function () { callback(statistics); }, 500);
+window.addEventListener("message", function listener(event) {
+    if (event.source === window && event.data && event.data.type === "blocked-requests") {
+        window.removeEventListener("message", listener);
+        clearTimeout(timer);
+        statistics.blocked = event.data.count;
+        callback(statistics);
+    }
+});
+window.postMessage({type: "blocked-requests-query"}, "*");
+"""
+
+
+def getBlockedURLPatterns(blockingSettings: dict, includeResourceTypes: bool) -> list[str]:
+    """
+    Description:
+        - Function to get the URL patterns to block as per blocking settings.
+
+    Args:
+        * blockingSettings (dict):
+            - The 'browser.blocking' section of settings.json.
+        * includeResourceTypes (bool):
+            - Whether to include the URL patterns of the resource types (for browsers which can't block by resource type).
+
+    Returns:
+        * list[str]:
+            - List of URL patterns ('*' is wildcard).
+    """
+    urlPatterns: list[str] = list(blockingSettings.get("url_patterns", []))
+    if includeResourceTypes:
+        for resourceType in blockingSettings.get("resource_types", []):
+            urlPatterns.extend(RESOURCE_TYPE_URL_PATTERNS.get(resourceType, []))
+    return urlPatterns
+
+
+def getFirefoxExtensionPath(urlPatterns: list[str], requestTypes: list[str]) -> str:
+    """
+    Description:
+        - Function to build the content blocking extension of Firefox (once per configuration).
+        - Extension is stored in the temporary directory and reused by all sessions.
+
+    Args:
+        * urlPatterns (list[str]):
+            - URL patterns to block ('*' is wildcard).
+        * requestTypes (list[str]):
+            - Request types (of WebExtension API) to block.
+
+    Returns:
+        * str:
+            - Path of the extension (.xpi).
+    """
+    backgroundScript: str = FIREFOX_EXTENSION_BACKGROUND_SCRIPT % (
+        json.dumps(urlPatterns),
+        json.dumps(requestTypes),
+    )
+    manifest: dict = {
+        "manifest_version": 2,
+        "name": "Content Blocking",
+        "version": "1.0",
+        "browser_specific_settings": {"gecko": {"id": FIREFOX_EXTENSION_ID}},
+        "permissions": ["webRequest", "webRequestBlocking", "<all_urls>"],
+        "background": {"scripts": ["background.js"]},
+        "content_scripts": [{"matches": ["<all_urls>"], "js": ["content.js"], "run_at": "document_start"}],
+    }
+
+    # Same configuration -> same file. So, extension is built only once.
+    digest: str = hashlib.sha1((backgroundScript + json.dumps(manifest)).encode("utf-8")).hexdigest()[:12]
+    extensionPath: str = os.path.join(tempfile.gettempdir(), f"content-blocking-{digest}.xpi")
+    if not os.path.exists(extensionPath):
+        with zipfile.ZipFile(extensionPath, "w") as extension:
+            extension.writestr("manifest.json", json.dumps(manifest))
+            extension.writestr("background.js", backgroundScript)
+            extension.writestr("content.js", FIREFOX_EXTENSION_CONTENT_SCRIPT)
+    return extensionPath
+
+
+def applyFirefoxBlockingOptions(firefoxOptions: FirefoxOptions, blockingSettings: dict) -> None:
+    """
+    Description:
+        - Function to apply the blocking profile to the options of Firefox (before the session is created).
+
+    Args:
+        * firefoxOptions (FirefoxOptions):
+            - Options of Firefox.
+        * blockingSettings (dict):
+            - The 'browser.blocking' section of settings.json.
+
+    Returns:
+        * None
+    """
+    firefoxOptions.page_load_strategy = blockingSettings.get("page_load_strategy", "normal")
+    if not blockingSettings.get("enabled"):
+        return
+    if blockingSettings.get("block_background_traffic", True):
+        for name, value in FIREFOX_BACKGROUND_TRAFFIC_PREFERENCES.items():
+            firefoxOptions.set_preference(name, value)
+    if "font" in blockingSettings.get("resource_types", []):
+        firefoxOptions.set_preference("gfx.downloadable_fonts.enabled", False)
+    if "media" in blockingSettings.get("resource_types", []):
+        firefoxOptions.set_preference("media.autoplay.default", 5)  # Block audio and video autoplay
+        firefoxOptions.set_preference("media.preload.default", 0)  # Don't preload media
+
+
+def enableFirefoxBlocking(driverInstance: Firefox, blockingSettings: dict) -> None:
+    """
+    Description:
+        - Function to enable the blocking of URL patterns and resource types in a Firefox session.
+        - Must be called just after the session is created (before loading any page).
+
+    Args:
+        * driverInstance (Firefox):
+            - The Firefox driver instance.
+        * blockingSettings (dict):
+            - The 'browser.blocking' section of settings.json.
+
+    Returns:
+        * None
+    """
+    if not blockingSettings.get("enabled"):
+        return
+    urlPatterns: list[str] = getBlockedURLPatterns(blockingSettings, includeResourceTypes=False)
+    requestTypes: list[str] = []
+    for resourceType in blockingSettings.get("resource_types", []):
+        requestTypes.extend(RESOURCE_TYPE_REQUEST_TYPES.get(resourceType, []))
+    if not urlPatterns and not requestTypes:
+        return
+    try:
+        driverInstance.install_addon(getFirefoxExtensionPath(urlPatterns, requestTypes), temporary=True)
+        # Used by getPageLoadStatistics() to query the extension (only if it is installed)
+        driverInstance._blockingExtensionInstalled = True
+    except Exception as e:
+        # Blocking is an optimization. So, never stop the application because of it.
+        print("Unable to enable content blocking in Firefox. Error Code: 3401")
+        print("Exception:", e)
+
+
+def applyChromeBlockingOptions(chromeOptions: ChromeOptions, blockingSettings: dict) -> None:
+    """
+    Description:
+        - Function to apply the blocking profile to the options of Chrome (before the session is created).
+
+    Args:
+        * chromeOptions (ChromeOptions):
+            - Options of Chrome.
+        * blockingSettings (dict):
+            - The 'browser.blocking' section of settings.json.
+
+    Returns:
+        * None
+    """
+    chromeOptions.page_load_strategy = blockingSettings.get("page_load_strategy", "normal")
+    if not blockingSettings.get("enabled"):
+        return
+    if blockingSettings.get("block_background_traffic", True):
+        for argument in CHROME_BACKGROUND_TRAFFIC_ARGUMENTS:
+            chromeOptions.add_argument(argument)
+    if blockingSettings.get("log_statistics"):
+        # Performance log is used to count the blocked requests
+        chromeOptions.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def enableChromeBlocking(driverInstance: Chrome | Edge, blockingSettings: dict) -> None:
+    """
+    Description:
+        - Function to enable the blocking of URL patterns and resource types in a Chrome session.
+        - Must be called just after the session is created (before loading any page).
+
+    Args:
+        * driverInstance (Chrome | Edge):
+            - The Chrome driver instance.
+        * blockingSettings (dict):
+            - The 'browser.blocking' section of settings.json.
+
+    Returns:
+        * None
+    """
+    if not blockingSettings.get("enabled"):
+        return
+    urlPatterns: list[str] = getBlockedURLPatterns(blockingSettings, includeResourceTypes=True)
+    if not urlPatterns:
+        return
+    try:
+        driverInstance.execute_cdp_cmd("Network.enable", {})
+        driverInstance.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urlPatterns})
+    except Exception as e:
+        # Blocking is an optimization. So, never stop the application because of it.
+        print("Unable to enable content blocking in Chrome. Error Code: 3402")
+        print("Exception:", e)
+
+
+def getChromeBlockedRequests(driverInstance: Chrome | Edge) -> int | None:
+    """
+    Description:
+        - Function to count the requests blocked since the last call (using the performance log of Chrome).
+
+    Returns:
+        * int | None:
+            - Number of blocked requests. None if performance log is not available.
+    """
+    try:
+        logs: list[dict] = driverInstance.get_log("performance")
+    except Exception:
+        return None
+    blocked: int = 0
+    for log in logs:
+        message: dict = json.loads(log["message"])["message"]
+        if message["method"] == "Network.loadingFailed" and message["params"].get("blockedReason"):
+            blocked += 1
+    return blocked
+
+
+def getPageLoadStatistics(driverInstance: Chrome | Edge | Firefox) -> dict:
+    """
+    Description:
+        - Function to get the statistics of the current page (requests made, bytes transferred, requests blocked).
+        - Bytes of blocked requests are unknown (never downloaded). So, saved bytes are estimated using the average size of the loaded requests.
+
+    Args:
+        * driverInstance (Chrome | Edge | Firefox):
+            - The driver instance.
+
+    Returns:
+        * dict:
+            - {"requests": int, "bytes": int, "blocked": int | None, "estimated_bytes_saved": int | None}
+            - 'blocked' is None if it can't be counted.
+    """
+    isFirefox: bool = isinstance(driverInstance, Firefox)
+    # Set by enableFirefoxBlocking() only if the extension is installed successfully. Otherwise the script would
+    # wait for the reply of the extension until its timeout.
+    isExtensionInstalled: bool = isFirefox and getattr(driverInstance, "_blockingExtensionInstalled", False)
+    statistics: dict = driverInstance.execute_async_script(PAGE_LOAD_STATISTICS_SCRIPT, isExtensionInstalled)
+    if not isFirefox:
+        statistics["blocked"] = getChromeBlockedRequests(driverInstance)
+
+    statistics["estimated_bytes_saved"] = None
+    if statistics["blocked"] is not None and statistics["requests"]:
+        statistics["estimated_bytes_saved"] = (
+            statistics["blocked"] * statistics["bytes"] // statistics["requests"]
+        )
+    return statistics
+
+
+def getPageLoadStatisticsSummary(driverInstance: Chrome | Edge | Firefox) -> str:
+    """
+    Description:
+        - Function to get a printable summary of the statistics of the current page.
+
+    Returns:
+        * str:
+            - Summary of the statistics. E.g: "42 requests, 812.4 KB transferred, 17 requests blocked (~330.1 KB saved)"
+    """
+    try:
+        statistics: dict = getPageLoadStatistics(driverInstance)
+    except Exception as e:
+        return f"statistics not available ({e.__class__.__name__})"
+    summary: str = f"{statistics['requests']} requests, {statistics['bytes'] / 1024:.1f} KB transferred"
+    if statistics["blocked"] is not None:
+        summary += f", {statistics['blocked']} requests blocked"
+        summary += f" (~{statistics['estimated_bytes_saved'] / 1024:.1f} KB saved)"
+    return summary
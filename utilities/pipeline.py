@@ -0,0 +1,496 @@
+"""
+    @file: utilities/pipeline.py
+    @author: Suraj Kumar Giri (https://github.com/surajgirioffl)
+    @init-date: 19th Oct 2026
+    @completed-on: N/A
+    @last-modified: 19th Oct 2026
+    @error-series: 3500
+    @description:
+        * Module to process a row as a pipeline of registered steps with a deadline (time budget) for each row.
+        * Each step has its own timeout and retry policy. Timings of each step are recorded automatically.
+        * Deadlines are cooperative. A step must pass deadline.remaining() into its waits (a running Selenium call can't be interrupted).
+        * Time spent waiting for the user (interactive steps, Deadline.paused()) doesn't consume the budget.
+        * Row deadline is checked before each abortable step starts. Once a non-abortable step (E.g: payment) starts,
+          it and all later steps always run (only their own timeouts apply). So, a row is never left half-done.
+"""
+
+__author__ = "Suraj Kumar Giri"
+__email__ = "surajgirioffl@gmail.com"
+
+import logging
+from math import inf
+from time import monotonic, sleep
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+
+class PipelineError(Exception):
+    """
+    Description:
+        - Base class of the errors raised by the pipeline.
+    """
+
+
+class StepFailed(PipelineError):
+    """
+    Description:
+        - Raised when a step fails on all of its attempts. Original exception is chained (__cause__).
+    """
+
+    def __init__(self, stepName: str, attempts: int, exception: BaseException) -> None:
+        super().__init__(f"Step '{stepName}' failed after {attempts} attempt(s): {exception!r}")
+        self.stepName = stepName
+        self.attempts = attempts
+
+
+class DeadlineExceeded(PipelineError):
+    """
+    Description:
+        - Raised when the deadline of the row is exceeded before all steps are completed.
+    """
+
+    def __init__(self, stepName: str, overrun: float) -> None:
+        super().__init__(f"Deadline of the row exceeded by {overrun:.2f} seconds after step '{stepName}'")
+        self.stepName = stepName
+        self.overrun = overrun
+
+
+class AbortRow(PipelineError):
+    """
+    Description:
+        - Raised by a step to abort the row immediately (without retries). E.g: required data of the row is missing.
+    """
+
+
+class StopPipeline(Exception):
+    """
+    Description:
+        - Raised by a step to stop the pipeline without any error. E.g: no more rows to process.
+    """
+
+
+class RetryStep(Exception):
+    """
+    Description:
+        - Raised by a step to retry it (if attempts are left). E.g: OTP is not received yet.
+    """
+
+
+class Deadline:
+    """
+    Description:
+        - Class to keep track of the remaining time of a time budget.
+        - A child deadline (step deadline) never outlives its parent (row deadline).
+    """
+
+    def __init__(self, budget: float | None = None, parent: "Deadline | None" = None) -> None:
+        """
+        Description:
+            - Initializes a new instance of the class. The deadline starts immediately.
+
+        Args:
+            * budget (float | None, optional):
+                - Time budget in seconds. None for no budget (only parent's budget, if any, is applied).
+                - Defaults to None.
+            * parent (Deadline | None, optional):
+                - Parent deadline. Remaining time is never more than parent's remaining time.
+                - Defaults to None.
+
+        Returns:
+            * None
+        """
+        self.startTime: float = monotonic()
+        self.expiresAt: float = inf if budget is None else self.startTime + budget
+        self.parent = parent
+
+    def remaining(self, cap: float | None = None) -> float:
+        """
+        Description:
+            - Method to get the remaining time of the deadline.
+
+        Args:
+            * cap (float | None, optional):
+                - Maximum value to return. Useful when there is no budget (remaining time is infinite).
+                - Defaults to None.
+
+        Returns:
+            * float:
+                - Remaining time in seconds (never negative). math.inf if there is no budget and no cap.
+        """
+        remainingTime: float = max(self.expiresAt - monotonic(), 0.0)
+        if self.parent is not None:
+            remainingTime = min(remainingTime, self.parent.remaining())
+        return remainingTime if cap is None else min(remainingTime, cap)
+
+    def elapsed(self) -> float:
+        """
+        Description:
+            - Method to get the time elapsed (in seconds) since the deadline started.
+        """
+        return monotonic() - self.startTime
+
+    def isExpired(self) -> bool:
+        """
+        Description:
+            - Method to check whether the deadline is expired.
+        """
+        return self.remaining() <= 0
+
+    def overrun(self) -> float:
+        """
+        Description:
+            - Method to get the time (in seconds) passed after the expiry of the deadline. 0 if not expired.
+        """
+        return max(monotonic() - self.expiresAt, 0.0)
+
+    def extend(self, seconds: float) -> None:
+        """
+        Description:
+            - Method to extend the deadline (and its parents) by the specified seconds.
+
+        Args:
+            * seconds (float):
+                - Seconds to extend the deadline by.
+
+        Returns:
+            * None
+        """
+        self.expiresAt += seconds
+        if self.parent is not None:
+            self.parent.extend(seconds)
+
+    @contextmanager
+    def paused(self) -> Iterator["Deadline"]:
+        """
+        Description:
+            - Context manager to pause the deadline while waiting for the user.
+            - The deadline is extended by the time spent inside the context.
+
+        Usage:
+            with deadline.paused():
+                input("Write OTP: ")
+        """
+        startTime: float = monotonic()
+        try:
+            yield self
+        finally:
+            self.extend(monotonic() - startTime)
+
+
+class RowContext:
+    """
+    Description:
+        - Class to share the state of a row between the steps of the pipeline.
+        - Steps can set any attribute on it (driver, row data, IP etc.).
+    """
+
+    def __init__(self, rowNumber: int, deadline: Deadline) -> None:
+        self.rowNumber = rowNumber
+        self.deadline = deadline
+        # Set by the pipeline before each attempt of a step
+        self.attempt: int = 1
+        self.isLastAttempt: bool = True
+        # Step name -> time taken (seconds) by the step including retries
+        self.timings: dict[str, float] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called if the attribute is not set by any step yet
+        return None
+
+
+class Step:
+    """
+    Description:
+        - Class to represent a step of the pipeline with its timeout and retry policy.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        function: Callable[[RowContext, Deadline], Any],
+        timeout: float | None = None,
+        retries: int = 0,
+        retryDelay: float = 0,
+        interactive: bool = False,
+        abortable: bool = True,
+        lastAttemptFallback: bool = False,
+    ) -> None:
+        """
+        Description:
+            - Initializes a new instance of the class.
+
+        Args:
+            * name (str):
+                - Name of the step (used in timings and logs).
+            * function (Callable[[RowContext, Deadline], Any]):
+                - Function of the step. It receives the row context and the deadline of the step.
+            * timeout (float | None, optional):
+                - Time budget (seconds) of the step including all retries. None for no timeout (only row deadline is applied).
+                - Defaults to None.
+            * retries (int, optional):
+                - Number of retries if the step raises an exception (or RetryStep).
+                - Defaults to 0.
+            * retryDelay (float, optional):
+                - Delay in seconds between the attempts.
+                - Defaults to 0.
+            * interactive (bool, optional):
+                - True if the step waits for the user. Time taken by the step extends the row deadline.
+                - Defaults to False.
+            * abortable (bool, optional):
+                - False if the row must not be aborted (on row deadline) once the step starts. E.g: payment is submitted.
+                - Row deadline is not applied to a non-abortable step (only its own timeout).
+                - Defaults to True.
+            * lastAttemptFallback (bool, optional):
+                - True if the step falls back to another way (E.g: asks the user) on its last attempt.
+                - If no time is left for the next retry, the last attempt is run immediately instead of failing the step.
+                - Defaults to False.
+
+        Returns:
+            * None
+        """
+        self.name = name
+        self.function = function
+        self.timeout = timeout
+        self.retries = retries
+        self.retryDelay = retryDelay
+        self.interactive = interactive
+        self.abortable = abortable
+        self.lastAttemptFallback = lastAttemptFallback
+
+
+class Pipeline:
+    """
+    Description:
+        - Class to run the registered steps of a row in order.
+    """
+
+    def __init__(self, rowBudget: float | None = None, stepSettings: dict[str, dict] | None = None) -> None:
+        """
+        Description:
+            - Initializes a new instance of the class.
+
+        Args:
+            * rowBudget (float | None, optional):
+                - Time budget (seconds) of each row. None for no budget.
+                - Defaults to None.
+            * stepSettings (dict[str, dict] | None, optional):
+                - Step name -> {"timeout", "retries", "retry_delay"} (as in settings.json).
+                - Overrides the values passed at the registration of the step.
+                - Defaults to None.
+
+        Returns:
+            * None
+        """
+        self.rowBudget = rowBudget
+        self.stepSettings: dict[str, dict] = stepSettings or {}
+        self.steps: list[Step] = []
+        # Step name -> time taken by the step in each row (seconds)
+        self.statistics: dict[str, list[float]] = {}
+
+    def step(
+        self,
+        name: str,
+        timeout: float | None = None,
+        retries: int = 0,
+        retryDelay: float = 0,
+        interactive: bool = False,
+        abortable: bool = True,
+        lastAttemptFallback: bool = False,
+    ) -> Callable[[Callable[[RowContext, Deadline], Any]], Callable[[RowContext, Deadline], Any]]:
+        """
+        Description:
+            - Decorator to register a function as the next step of the pipeline.
+            - Values in stepSettings (if any) override the values passed here.
+            - Once a non-abortable step is registered, all later steps are also non-abortable.
+
+        Usage:
+            @pipeline.step("fetch_row", timeout=30, retries=2)
+            def fetchRow(context: RowContext, deadline: Deadline) -> None:
+                ...
+        """
+        settings: dict = self.stepSettings.get(name, {})
+        # Steps after a non-abortable step must run too (E.g: recording the payment)
+        abortable = abortable and all(step.abortable for step in self.steps)
+
+        def register(
+            function: Callable[[RowContext, Deadline], Any]
+        ) -> Callable[[RowContext, Deadline], Any]:
+            self.steps.append(
+                Step(
+                    name,
+                    function,
+                    timeout=settings.get("timeout", timeout),
+                    retries=settings.get("retries", retries),
+                    retryDelay=settings.get("retry_delay", retryDelay),
+                    interactive=interactive,
+                    abortable=abortable,
+                    lastAttemptFallback=lastAttemptFallback,
+                )
+            )
+            return function
+
+        return register
+
+    def newContext(self, rowNumber: int) -> RowContext:
+        """
+        Description:
+            - Method to get a new context (with a new deadline) for the specified row.
+        """
+        return RowContext(rowNumber, Deadline(self.rowBudget))
+
+    def runStep(self, step: Step, context: RowContext) -> None:
+        """
+        Description:
+            - Method to run a step with its retry policy.
+
+        Args:
+            * step (Step):
+                - The step to run.
+            * context (RowContext):
+                - Context of the row.
+
+        Returns:
+            * None
+
+        Raises:
+            * StopPipeline:
+                - If the step stops the pipeline.
+            * AbortRow:
+                - If the step aborts the row. It is never retried.
+            * StepFailed:
+                - If the step fails on all attempts (or no time is left for next attempt).
+        """
+        # Interactive steps wait for the user and non-abortable steps must complete even if the row deadline is exceeded.
+        # So, only their own timeout (if any) is applied.
+        rowDeadline: Deadline | None = context.deadline if step.abortable and not step.interactive else None
+        stepDeadline = Deadline(step.timeout, parent=rowDeadline)
+        attempts: int = step.retries + 1
+        attempt: int = 0
+        isFallbackAttempt: bool = False
+        while True:
+            attempt += 1
+            context.attempt = attempt
+            context.isLastAttempt = attempt >= attempts or isFallbackAttempt
+            try:
+                step.function(context, stepDeadline)
+                return
+            except (StopPipeline, AbortRow):
+                raise
+            except Exception as e:
+                if context.isLastAttempt:
+                    raise StepFailed(step.name, attempt, e) from e
+                if stepDeadline.remaining() <= step.retryDelay:
+                    if not step.lastAttemptFallback:
+                        raise StepFailed(step.name, attempt, e) from e
+                    # No time for retries. But the step can still fall back on its last attempt (E.g: asks the user).
+                    print(
+                        f"Step '{step.name}' is out of time. Running the last attempt now. Error Code: 3503"
+                    )
+                    print("Exception:", e)
+                    isFallbackAttempt = True
+                    continue
+                print(
+                    f"Step '{step.name}' failed on attempt {attempt}/{attempts}. Retrying... Error Code: 3501"
+                )
+                print("Exception:", e)
+                logging.warning(
+                    f"Row {context.rowNumber}: step '{step.name}' attempt {attempt} failed: {e!r}"
+                )
+                sleep(step.retryDelay)
+
+    def run(self, context: RowContext) -> dict[str, float]:
+        """
+        Description:
+            - Method to run all steps of the pipeline for a row.
+            - Row deadline is checked before each abortable step (except the first). Non-abortable steps always run.
+
+        Args:
+            * context (RowContext):
+                - Context of the row (see Pipeline.newContext()).
+
+        Returns:
+            * dict[str, float]:
+                - Step name -> time taken (seconds) by the step.
+
+        Raises:
+            * StopPipeline:
+                - If a step stops the pipeline.
+            * AbortRow:
+                - If a step aborts the row.
+            * StepFailed:
+                - If a step fails on all attempts.
+            * DeadlineExceeded:
+                - If the deadline of the row is exceeded before an abortable step is started.
+        """
+        for index, step in enumerate(self.steps):
+            # Checked before an abortable step starts (not after a step ends). So, the result of a completed step
+            # (E.g: OTP written by the user on the fallback attempt) is never thrown away.
+            if step.abortable and index > 0 and context.deadline.isExpired():
+                raise DeadlineExceeded(self.steps[index - 1].name, context.deadline.overrun())
+
+            startTime: float = monotonic()
+            try:
+                self.runStep(step, context)
+            finally:
+                timeTaken: float = monotonic() - startTime
+                context.timings[step.name] = timeTaken
+                self.statistics.setdefault(step.name, []).append(timeTaken)
+                if step.interactive:
+                    context.deadline.extend(timeTaken)
+
+            if step.timeout is not None and timeTaken > step.timeout:
+                print(f"Step '{step.name}' took {timeTaken:.2f}s (timeout {step.timeout}s). Error Code: 3502")
+                logging.warning(f"Row {context.rowNumber}: step '{step.name}' exceeded its timeout.")
+        return context.timings
+
+    def getTimingsSummary(self, timings: dict[str, float]) -> str:
+        """
+        Description:
+            - Method to get a printable summary of the timings of a row.
+
+        Args:
+            * timings (dict[str, float]):
+                - Step name -> time taken (seconds). Returned by Pipeline.run() or RowContext.timings.
+
+        Returns:
+            * str:
+                - Summary like "init_browser 4.21s | fetch_row 0.80s | ..."
+        """
+        return " | ".join(f"{name} {timeTaken:.2f}s" for name, timeTaken in timings.items())
+
+    def getStatisticsSummary(self) -> str:
+        """
+        Description:
+            - Method to get a printable summary (mean and max) of all steps in all rows. Slowest step first.
+
+        Returns:
+            * str:
+                - One line for each step.
+        """
+        lines: list[str] = []
+        for name, timings in sorted(self.statistics.items(), key=lambda item: -sum(item[1]) / len(item[1])):
+            lines.append(
+                f"{name:<22} rows: {len(timings):>4}  mean: {sum(timings) / len(timings):>8.2f}s  max: {max(timings):>8.2f}s"
+            )
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    pipeline = Pipeline(rowBudget=5, stepSettings={"flaky": {"retries": 2}})
+
+    @pipeline.step("fast")
+    def fast(context: RowContext, deadline: Deadline) -> None:
+        context.value = 1
+
+    @pipeline.step("flaky", retryDelay=0.1)
+    def flaky(context: RowContext, deadline: Deadline) -> None:
+        if context.attempt < 3:
+            raise RetryStep("not ready yet")
+
+    @pipeline.step("slow", timeout=1)
+    def slow(context: RowContext, deadline: Deadline) -> None:
+        sleep(min(0.5, deadline.remaining()))
+
+    for rowNumber in range(2, 5):
+        print(pipeline.getTimingsSummary(pipeline.run(pipeline.newContext(rowNumber))))
+    print(pipeline.getStatisticsSummary())
@@ -3,10 +3,14 @@
     @author: Suraj Kumar Giri (https://github.com/surajgirioffl)
     @init-date: 25th Nov 2023
     @completed-on: N/A
-    @last-modified: 21st Jan 2024
+    @last-modified: 19th Oct 2026
     @error-series: 3200
     @description:
         * Module to provide specific tools requires while performing scraping.
+        * Element cache (per driver) to avoid finding the same locator again and again (each find is a round trip to the driver).
+            - Cache is dropped automatically on navigation (get/back/forward/refresh), URL change and frame switch.
+            - Cached elements re-find themselves transparently on StaleElementReferenceException.
+            - Elements cached by a wait helper wait for their locator (up to the wait time of the helper) while re-finding.
 """
 __author__ = "Suraj Kumar Giri"
 __email__ = "surajgirioffl@gmail.com"
@@ -15,8 +19,215 @@ from time import time
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.command import Command
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 from selenium.webdriver import Chrome, Edge, Firefox
+from typing import Any, Callable
+
+# Commands which load a new document in the current window. So, all cached elements of the window become stale.
+NAVIGATION_COMMANDS: frozenset[str] = frozenset(
+    {Command.GET, Command.GO_BACK, Command.GO_FORWARD, Command.REFRESH}
+)
+# Commands which change the browsing context (frame) of the current window.
+FRAME_COMMANDS: frozenset[str] = frozenset({Command.SWITCH_TO_FRAME, Command.SWITCH_TO_PARENT_FRAME})
+
+
+class CachedWebElement(WebElement):
+    """
+    Description:
+        - WebElement which remembers its locator and re-finds itself (once) if it becomes stale.
+        - A re-find waits for the locator up to maxWaitTime (E.g: element is being re-rendered).
+        - A re-find raises NoSuchElementException (maxWaitTime is 0) or TimeoutException if the element no longer exists.
+    """
+
+    def __init__(
+        self,
+        parent: Chrome | Edge | Firefox,
+        id_: str,
+        elementLocator: tuple,
+        cache: "ElementCache",
+        maxWaitTime: float = 0,
+    ):
+        super().__init__(parent, id_)
+        self._locator = elementLocator
+        self._cache = cache
+        self.maxWaitTime = maxWaitTime
+
+    def _refind(self) -> None:
+        # Finding using the original find_element (not cached) and using the new id for this element
+        if self.maxWaitTime > 0:
+            # First poll is a plain find. So, no extra round trip if the element is already present.
+            wait = WebDriverWait(self._parent, self.maxWaitTime)
+            self._id = wait.until(expected_conditions.presence_of_element_located(self._locator)).id
+        else:
+            self._id = self._parent.find_element(*self._locator).id
+        self._cache.staleRefinds += 1
+
+    def _retryIfStale(self, method: Callable, *args) -> Any:
+        try:
+            return method(*args)
+        except StaleElementReferenceException:
+            self._refind()
+            return method(*args)
+
+    def _execute(self, command, params=None):
+        # All element commands (click, send_keys, text, etc.) pass through it.
+        return self._retryIfStale(super()._execute, command, params)
+
+    def is_displayed(self) -> bool:
+        # Executed as a script (not through _execute)
+        return self._retryIfStale(super().is_displayed)
+
+    def get_attribute(self, name) -> str | None:
+        # Executed as a script (not through _execute)
+        return self._retryIfStale(super().get_attribute, name)
+
+
+class ElementCache:
+    """
+    Description:
+        - Class to cache the elements of a driver by (window handle, locator).
+        - Hooks the execute() method of the driver to drop the cache on navigation, URL change and frame switch.
+        - Don't instantiate it directly. Use getElementCache().
+    """
+
+    def __init__(self, driverInstance: Chrome | Edge | Firefox) -> None:
+        # (window handle, locator) -> element
+        self.elements: dict[tuple[str | None, tuple], CachedWebElement] = {}
+        # Window handle -> last known URL of the window
+        self.urls: dict[str | None, str] = {}
+        self.currentWindowHandle: str | None = driverInstance.current_window_handle
+        self.hits: int = 0
+        self.misses: int = 0
+        self.staleRefinds: int = 0
+        self.invalidations: int = 0
+
+        originalExecute: Callable = driverInstance.execute
+
+        def execute(driverCommand: str, params: dict | None = None) -> dict:
+            if driverCommand in NAVIGATION_COMMANDS or driverCommand in FRAME_COMMANDS:
+                self.invalidate()
+            elif driverCommand == Command.QUIT:
+                self.invalidate(allWindows=True)
+            elif driverCommand == Command.CLOSE:
+                self.invalidate()
+                self.urls.pop(self.currentWindowHandle, None)
+
+            response: dict = originalExecute(driverCommand, params)
+
+            if driverCommand == Command.SWITCH_TO_WINDOW:
+                self.currentWindowHandle = params["handle"]
+            elif driverCommand == Command.GET_CURRENT_URL:
+                # Page may be changed by a click, script or redirect (no navigation command)
+                url: str = response["value"]
+                if self.urls.get(self.currentWindowHandle, url) != url:
+                    self.invalidate()
+                self.urls[self.currentWindowHandle] = url
+            return response
+
+        driverInstance.execute = execute
+
+    def get(self, elementLocator: tuple, maxWaitTime: float | None = None) -> CachedWebElement | None:
+        # maxWaitTime (if any) is used by the element while re-finding
+        element: CachedWebElement | None = self.elements.get((self.currentWindowHandle, elementLocator))
+        if element is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            if maxWaitTime is not None:
+                element.maxWaitTime = maxWaitTime
+        return element
+
+    def store(self, elementLocator: tuple, element: WebElement, maxWaitTime: float = 0) -> CachedWebElement:
+        if not isinstance(element, CachedWebElement):
+            element = CachedWebElement(element.parent, element.id, elementLocator, self, maxWaitTime)
+        else:
+            element.maxWaitTime = maxWaitTime
+        self.elements[(self.currentWindowHandle, elementLocator)] = element
+        return element
+
+    def invalidate(self, allWindows: bool = False) -> None:
+        if allWindows:
+            self.elements.clear()
+            self.urls.clear()
+        else:
+            self.elements = {
+                key: element for key, element in self.elements.items() if key[0] != self.currentWindowHandle
+            }
+            self.urls.pop(self.currentWindowHandle, None)
+        self.invalidations += 1
+
+
+def getElementCache(driverInstance: Chrome | Edge | Firefox) -> ElementCache:
+    """
+    Description:
+        - Function to get the element cache of a Driver Instance. Cache is created on first call.
+
+    Args:
+        * driverInstance (Chrome | Edge | Firefox):
+            - The Driver Instance.
+
+    Returns:
+        * ElementCache:
+            - Element cache of the Driver Instance.
+    """
+    cache: ElementCache | None = getattr(driverInstance, "_elementCache", None)
+    if cache is None:
+        cache = ElementCache(driverInstance)
+        driverInstance._elementCache = cache
+    return cache
+
+
+def getElementCacheStatistics(driverInstance: Chrome | Edge | Firefox) -> dict[str, int]:
+    """
+    Description:
+        - Function to get the statistics of the element cache of a Driver Instance.
+
+    Args:
+        * driverInstance (Chrome | Edge | Firefox):
+            - The Driver Instance.
+
+    Returns:
+        * dict[str, int]:
+            - hits, misses, stale_refinds (transparent re-finds), invalidations and size (cached elements).
+    """
+    cache: ElementCache | None = getattr(driverInstance, "_elementCache", None)
+    if cache is None:
+        return {"hits": 0, "misses": 0, "stale_refinds": 0, "invalidations": 0, "size": 0}
+    return {
+        "hits": cache.hits,
+        "misses": cache.misses,
+        "stale_refinds": cache.staleRefinds,
+        "invalidations": cache.invalidations,
+        "size": len(cache.elements),
+    }
+
+
+def findElement(driverInstance: Chrome | Edge | Firefox, elementLocator: tuple) -> WebElement:
+    """
+    Description:
+        - Function to find an element using the element cache of the Driver Instance.
+        - Same as driverInstance.find_element(*elementLocator) but no round trip if the element is cached.
+
+    Args:
+        * driverInstance (Chrome | Edge | Firefox):
+            - The Driver Instance.
+        * elementLocator (tuple):
+            - The locator of the element. E.g: (By.ID, "myElementId")
+
+    Returns:
+        * WebElement:
+            - The element (CachedWebElement) specified via the elementLocator.
+
+    Raises:
+        * selenium.common.exceptions.NoSuchElementException
+            - If the element is not found.
+    """
+    cache: ElementCache = getElementCache(driverInstance)
+    element: CachedWebElement | None = cache.get(elementLocator)
+    if element is not None:
+        return element
+    return cache.store(elementLocator, driverInstance.find_element(*elementLocator))
 
 
 def waitUntilElementLoadedInDOM(
@@ -53,10 +264,17 @@ def waitUntilElementLoadedInDOM(
         * selenium.common.exceptions.NoSuchElementException
             - If the element is not found.
     """
+    # Cached element is returned without any round trip. If it is stale on its first use, it waits for the
+    # locator (up to maxWaitTime) while re-finding.
+    cache: ElementCache = getElementCache(driverInstance)
+    element: CachedWebElement | None = cache.get(elementLocator, maxWaitTime)
+    if element is not None:
+        return element
+
     # Set a maximum wait time (in seconds)
     wait = WebDriverWait(driverInstance, maxWaitTime)
-    element: WebElement = wait.until(expected_conditions.presence_of_element_located(elementLocator))
-    return element
+    element = wait.until(expected_conditions.presence_of_element_located(elementLocator))
+    return cache.store(elementLocator, element, maxWaitTime)
 
 
 def waitUntilElementBecomeVisible(
@@ -95,8 +313,13 @@ def waitUntilElementBecomeVisible(
     """
     # Set a maximum wait time (in seconds)
     wait = WebDriverWait(driverInstance, maxWaitTime)
-    element: WebElement = wait.until(expected_conditions.visibility_of_element_located(elementLocator))
-    return element
+    cache: ElementCache = getElementCache(driverInstance)
+    element: WebElement | None = cache.get(elementLocator, maxWaitTime)
+    if element is not None:
+        # Only visibility needs to be checked (no find)
+        return wait.until(expected_conditions.visibility_of(element))
+    element = wait.until(expected_conditions.visibility_of_element_located(elementLocator))
+    return cache.store(elementLocator, element, maxWaitTime)
 
 
 def waitUntilElementBecomeClickable(
@@ -135,8 +358,11 @@ def waitUntilElementBecomeClickable(
     """
     # Set a maximum wait time (in seconds)
     wait = WebDriverWait(driverInstance, maxWaitTime)
-    element: WebElement = wait.until(expected_conditions.element_to_be_clickable(elementLocator))
-    return element
+    cache: ElementCache = getElementCache(driverInstance)
+    element: WebElement | None = cache.get(elementLocator, maxWaitTime)
+    # Cached element (if any) is checked directly (no find)
+    element = wait.until(expected_conditions.element_to_be_clickable(element or elementLocator))
+    return cache.store(elementLocator, element, maxWaitTime)
 
 
 def waitUntilCurrentURLContainsExpectedURLFragment(
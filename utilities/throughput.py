@@ -0,0 +1,243 @@
+"""
+    @file: utilities/throughput.py
+    @author: Suraj Kumar Giri (https://github.com/surajgirioffl)
+    @init-date: 19th Oct 2026
+    @completed-on: N/A
+    @last-modified: 19th Oct 2026
+    @error-series: 3300
+    @description:
+        * Module to estimate throughput (rows per hour) and ETA of the remaining rows of the sheet.
+"""
+
+__author__ = "Suraj Kumar Giri"
+__email__ = "surajgirioffl@gmail.com"
+
+from os.path import exists
+from datetime import datetime, timedelta
+from utilities import tools
+
+
+class ThroughputEstimator:
+    """
+    Description:
+        - Class to estimate the throughput and ETA of the remaining rows using the time taken by each processed row.
+        - Uses an exponentially weighted mean of row durations, so recent rows matter more than older ones.
+        - Outliers (a row stuck for a long time or a row finished suspiciously fast) are trimmed before averaging.
+        - A second (faster) weighted mean is compared against the main one to show the trend.
+        - Estimates are persisted in a JSON file, so a resumed run starts with a warm estimate.
+    """
+
+    # Trend arrows
+    FASTER = "↑"
+    SLOWER = "↓"
+    STEADY = "→"
+
+    def __init__(
+        self,
+        statFilePath: str = "appdata/throughput_statistics.json",
+        smoothingFactor: float = 0.2,
+        trendSmoothingFactor: float = 0.6,
+        outlierTrimFactor: float = 3.0,
+        trendTolerance: float = 0.05,
+    ) -> None:
+        """
+        Description:
+            - Initializes a new instance of the class and loads the persisted estimate (if any).
+
+        Args:
+            * statFilePath (str, optional):
+                - Path of the JSON file to persist the estimate.
+                - Defaults to "appdata/throughput_statistics.json".
+            * smoothingFactor (float, optional):
+                - Weight (0 to 1) of the latest row in the main weighted mean.
+                - Defaults to 0.2.
+            * trendSmoothingFactor (float, optional):
+                - Weight (0 to 1) of the latest row in the fast weighted mean (used for trend).
+                - Must be greater than smoothingFactor.
+                - Defaults to 0.6.
+            * outlierTrimFactor (float, optional):
+                - Durations greater than (mean * outlierTrimFactor) or less than (mean / outlierTrimFactor) are trimmed to these bounds.
+                - Defaults to 3.0.
+            * trendTolerance (float, optional):
+                - Relative difference between both means below which the trend is considered steady.
+                - Defaults to 0.05 (5%).
+
+        Returns:
+            * None
+        """
+        self.statFilePath = statFilePath
+        self.smoothingFactor = smoothingFactor
+        self.trendSmoothingFactor = trendSmoothingFactor
+        self.outlierTrimFactor = outlierTrimFactor
+        self.trendTolerance = trendTolerance
+
+        self.meanRowDuration: float | None = None  # In seconds
+        self.fastMeanRowDuration: float | None = None  # In seconds
+        self.totalRows: int = 0
+        self.trimmedRows: int = 0
+
+        if exists(statFilePath):
+            self.load()
+
+    def load(self) -> bool:
+        """
+        Description:
+            - Method to load the persisted estimate from the statistics file.
+
+        Returns:
+            * bool:
+                - True if the estimate is loaded successfully, False otherwise.
+        """
+        statistics: dict = tools.loadJSONFile(self.statFilePath)
+        if not statistics:
+            return False
+        try:
+            self.meanRowDuration = statistics["mean_row_duration"]
+            self.fastMeanRowDuration = statistics["fast_mean_row_duration"]
+            self.totalRows = int(statistics["total_rows"])
+            self.trimmedRows = int(statistics["trimmed_rows"])
+        except Exception as e:
+            print("Invalid throughput statistics file. Starting with a cold estimate. Error Code: 3301")
+            print("Exception:", e)
+            self.meanRowDuration = self.fastMeanRowDuration = None
+            self.totalRows = self.trimmedRows = 0
+            return False
+        return True
+
+    def save(self) -> bool:
+        """
+        Description:
+            - Method to persist the current estimate to the statistics file.
+
+        Returns:
+            * bool:
+                - True if the estimate is saved successfully, False otherwise.
+        """
+        statistics: dict = {
+            "mean_row_duration": self.meanRowDuration,
+            "fast_mean_row_duration": self.fastMeanRowDuration,
+            "total_rows": self.totalRows,
+            "trimmed_rows": self.trimmedRows,
+            "updated_at": str(datetime.today()),
+        }
+        return tools.saveDictAsJSON(statistics, self.statFilePath)
+
+    def addRowDuration(self, duration: float) -> None:
+        """
+        Description:
+            - Method to feed the time taken by a processed row into the estimator.
+
+        Args:
+            * duration (float):
+                - Time taken by the row in seconds.
+
+        Returns:
+            * None
+        """
+        if duration <= 0:
+            return
+
+        self.totalRows += 1
+        if self.meanRowDuration is None:
+            # First row (cold estimate). Nothing to compare with.
+            self.meanRowDuration = self.fastMeanRowDuration = duration
+            return
+
+        # Trimming outliers to the bounds. So, a single stuck row can't ruin the estimate
+        # but a sustained slowdown still moves the estimate towards the new durations.
+        upperBound: float = self.meanRowDuration * self.outlierTrimFactor
+        lowerBound: float = self.meanRowDuration / self.outlierTrimFactor
+        if duration > upperBound or duration < lowerBound:
+            self.trimmedRows += 1
+            duration = min(max(duration, lowerBound), upperBound)
+
+        self.meanRowDuration += self.smoothingFactor * (duration - self.meanRowDuration)
+        self.fastMeanRowDuration += self.trendSmoothingFactor * (duration - self.fastMeanRowDuration)
+
+    def getRowsPerHour(self) -> float | None:
+        """
+        Description:
+            - Method to get the estimated throughput.
+
+        Returns:
+            * float | None:
+                - Estimated number of rows processed per hour.
+                - None if no row is processed yet.
+        """
+        if not self.meanRowDuration:
+            return None
+        return 3600 / self.meanRowDuration
+
+    def getRemainingTime(self, remainingRows: int) -> timedelta | None:
+        """
+        Description:
+            - Method to get the estimated time to process the remaining rows.
+
+        Args:
+            * remainingRows (int):
+                - Number of rows remaining to be processed.
+
+        Returns:
+            * timedelta | None:
+                - Estimated time to process the remaining rows.
+                - None if no row is processed yet.
+        """
+        if self.meanRowDuration is None:
+            return None
+        return timedelta(seconds=round(self.meanRowDuration * max(remainingRows, 0)))
+
+    def getTrendArrow(self) -> str:
+        """
+        Description:
+            - Method to get the trend of the throughput based on the recent rows.
+
+        Returns:
+            * str:
+                - ThroughputEstimator.FASTER if recent rows are faster than the average.
+                - ThroughputEstimator.SLOWER if recent rows are slower than the average.
+                - ThroughputEstimator.STEADY otherwise (or if there is not enough data).
+        """
+        if not self.meanRowDuration or self.fastMeanRowDuration is None:
+            return self.STEADY
+        change: float = (self.fastMeanRowDuration - self.meanRowDuration) / self.meanRowDuration
+        if change > self.trendTolerance:
+            return self.SLOWER
+        if change < -self.trendTolerance:
+            return self.FASTER
+        return self.STEADY
+
+    def getSummary(self, remainingRows: int) -> str:
+        """
+        Description:
+            - Method to get a printable summary of the throughput and ETA.
+
+        Args:
+            * remainingRows (int):
+                - Number of rows remaining to be processed. Negative value is treated as 0.
+
+        Returns:
+            * str:
+                - Summary containing rows per hour, trend, remaining rows, remaining time and ETA.
+        """
+        # Last row number may be stale (E.g: rows are appended during the run)
+        remainingRows = max(remainingRows, 0)
+        rowsPerHour: float | None = self.getRowsPerHour()
+        remainingTime: timedelta | None = self.getRemainingTime(remainingRows)
+        if rowsPerHour is None or remainingTime is None:
+            return f"Throughput: N/A (not enough data) | Remaining rows: {remainingRows}"
+
+        eta: datetime = datetime.now() + remainingTime
+        return (
+            f"Throughput: {rowsPerHour:.1f} rows/hour {self.getTrendArrow()} | "
+            f"Remaining rows: {remainingRows} | "
+            f"Remaining time: {remainingTime} | "
+            f"ETA: {eta.strftime('%d %b %Y %I:%M %p')}"
+        )
+
+
+if __name__ == "__main__":
+    estimator = ThroughputEstimator("test.json")
+    for rowDuration in [120, 110, 130, 900, 125, 180, 190, 200]:
+        estimator.addRowDuration(rowDuration)
+        print(estimator.getSummary(50))
+    estimator.save()
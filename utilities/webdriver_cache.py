@@ -0,0 +1,167 @@
+"""
+    @file: utilities/webdriver_cache.py
+    @author: Suraj Kumar Giri (https://github.com/surajgirioffl)
+    @init-date: 19th Oct 2026
+    @completed-on: N/A
+    @last-modified: 19th Oct 2026
+    @error-series: 3600
+    @description:
+        * Module to cache the driver and browser binaries resolved by Selenium Manager.
+        * Without the cache, Selenium Manager is spawned (and probes the disk/network) on every browser launch.
+        * Resolution is done once per run and persisted in a JSON file. Persisted paths are reused only if
+          both binaries still exist with the same modification time (so, an updated browser/driver is resolved again).
+        * If a launch fails with the resolved paths, the entry must be invalidated (see WebDriverCache.invalidate()).
+"""
+
+__author__ = "Suraj Kumar Giri"
+__email__ = "surajgirioffl@gmail.com"
+
+from os.path import exists, getmtime
+from time import perf_counter
+from datetime import datetime
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.common.selenium_manager import SeleniumManager
+from utilities import tools
+
+
+def getModificationTime(path: str | None) -> float | None:
+    """
+    Description:
+        - Function to get the modification time of a file.
+
+    Args:
+        * path (str | None):
+            - Path of the file.
+
+    Returns:
+        * float | None:
+            - Modification time of the file. None if path is None or file doesn't exist.
+    """
+    if not path or not exists(path):
+        return None
+    return getmtime(path)
+
+
+class WebDriverCache:
+    """
+    Description:
+        - Class to resolve the driver and browser binaries of each browser once and reuse them for later sessions.
+    """
+
+    def __init__(self, cacheFilePath: str = "appdata/webdriver_cache.json") -> None:
+        """
+        Description:
+            - Initializes a new instance of the class and loads the persisted resolutions (if any).
+
+        Args:
+            * cacheFilePath (str, optional):
+                - Path of the JSON file to persist the resolutions.
+                - Defaults to "appdata/webdriver_cache.json".
+
+        Returns:
+            * None
+        """
+        self.cacheFilePath = cacheFilePath
+        # Browser name -> {"driver_path", "driver_mtime", "browser_path", "browser_mtime", ...}
+        self.entries: dict[str, dict] = tools.loadJSONFile(cacheFilePath) if exists(cacheFilePath) else {}
+        # Browsers whose entry is resolved or verified in this run. No need to check them again.
+        self.verifiedBrowsers: set[str] = set()
+
+    def isValidEntry(self, entry: dict) -> bool:
+        """
+        Description:
+            - Method to check whether a persisted entry can be reused.
+
+        Args:
+            * entry (dict):
+                - Persisted entry of a browser.
+
+        Returns:
+            * bool:
+                - True if both driver and browser still exist with the same modification time, False otherwise.
+                - False if the entry has no browser path (can't be verified).
+        """
+        try:
+            driverModificationTime: float | None = getModificationTime(entry["driver_path"])
+            if driverModificationTime is None or driverModificationTime != entry["driver_mtime"]:
+                return False
+            browserModificationTime: float | None = getModificationTime(entry["browser_path"])
+            # Entry without browser path can't be verified (browser may be updated). So, resolved again.
+            return browserModificationTime is not None and browserModificationTime == entry["browser_mtime"]
+        except Exception:
+            # Corrupted entry
+            return False
+
+    def resolve(self, browserName: str, options: ArgOptions) -> tuple[str, str | None]:
+        """
+        Description:
+            - Method to get the driver and browser paths of the specified browser.
+            - Selenium Manager is used only if there is no valid entry in the cache.
+
+        Args:
+            * browserName (str):
+                - Name of the browser (key of the cache). E.g: "chrome", "firefox", "edge".
+            * options (ArgOptions):
+                - Options of the browser. Used by Selenium Manager (browser version, binary location, proxy).
+
+        Returns:
+            * tuple[str, str | None]:
+                - Driver path and browser path (None if Selenium Manager doesn't report a browser path).
+
+        Raises:
+            * Exception:
+                - If Selenium Manager fails to resolve the driver.
+        """
+        entry: dict | None = self.entries.get(browserName)
+        if entry and (browserName in self.verifiedBrowsers or self.isValidEntry(entry)):
+            self.verifiedBrowsers.add(browserName)
+            return entry["driver_path"], entry["browser_path"]
+
+        startTime: float = perf_counter()
+        # Selenium Manager also sets options.binary_location to the resolved browser path.
+        driverPath: str = SeleniumManager().driver_location(options)
+        browserPath: str | None = getattr(options, "binary_location", None) or None
+        resolutionTime: float = perf_counter() - startTime
+
+        self.entries[browserName] = {
+            "driver_path": driverPath,
+            "driver_mtime": getModificationTime(driverPath),
+            "browser_path": browserPath,
+            "browser_mtime": getModificationTime(browserPath),
+            "resolution_time": round(resolutionTime, 3),
+            "resolved_at": str(datetime.today()),
+        }
+        self.verifiedBrowsers.add(browserName)
+        if not tools.saveDictAsJSON(self.entries, self.cacheFilePath):
+            print("Unable to persist the resolved webdriver paths. Error Code: 3601")
+        return driverPath, browserPath
+
+    def invalidate(self, browserName: str | None = None) -> None:
+        """
+        Description:
+            - Method to remove the cached entry of the specified browser (or all browsers).
+            - Use it if a launch fails with the cached paths.
+
+        Args:
+            * browserName (str | None, optional):
+                - Name of the browser. None to remove all entries.
+                - Defaults to None.
+
+        Returns:
+            * None
+        """
+        if browserName is None:
+            self.entries.clear()
+            self.verifiedBrowsers.clear()
+        else:
+            self.entries.pop(browserName, None)
+            self.verifiedBrowsers.discard(browserName)
+        tools.saveDictAsJSON(self.entries, self.cacheFilePath)
+
+
+if __name__ == "__main__":
+    from selenium.webdriver.firefox.options import Options
+
+    cache = WebDriverCache("test.json")
+    print(cache.resolve("firefox", Options()))
+    print(cache.resolve("firefox", Options()))